@@ -0,0 +1,97 @@
+"""
+Throughput and latency of the posts list served by the sync viewset
+(``/posts/``) and by the async view (``/async/posts/``) at growing numbers
+of concurrent clients.
+
+Start the servers to compare in another shell, for example the ASGI app with
+``uvicorn blogger.asgi:application --port 8001`` and the WSGI app with a
+fixed number of threads, e.g.
+``gunicorn blogger.wsgi --threads 8 --bind 127.0.0.1:8000``, then run
+
+    python -m benchmarks.async_reads http://127.0.0.1:8000/posts/ \\
+        http://127.0.0.1:8001/async/posts/
+
+Any other list or detail URL works as well. Requests are sent by a plain
+asyncio HTTP/1.1 client, one connection per concurrent client, so the
+benchmark needs no third-party package.
+
+On Django 4.1 the async ORM runs every query of a uvicorn process on one
+shared thread, see posts.async_views: the async view does not run queries
+in parallel, so compare it with a WSGI server given the same number of
+processes, and expect its throughput to level off once the database
+time of a request dominates.
+
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from urllib.parse import urlsplit
+
+CONCURRENCY = (1, 10, 50, 200)
+DURATION = 5
+
+
+async def fetch(reader, writer, host, path):
+    writer.write(
+        f'GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n\r\n'.encode()
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(url, deadline, latencies, errors):
+    parts = urlsplit(url)
+    path = parts.path + (f'?{parts.query}' if parts.query else '')
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            status = await fetch(reader, writer, parts.netloc, path)
+            latencies.append(time.perf_counter() - started)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def measure(url, concurrency, duration):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        client(url, deadline, latencies, errors) for _ in range(concurrency)
+    ))
+    return latencies, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=CONCURRENCY)
+    parser.add_argument('--duration', type=float, default=DURATION, help='seconds per run')
+    args = parser.parse_args()
+
+    print(f'{"url":<40} {"clients":>7} {"req/s":>9} {"p50, ms":>8} {"p99, ms":>8} {"errors":>6}')
+    for url in args.urls:
+        for concurrency in args.concurrency:
+            latencies, errors = asyncio.run(measure(url, concurrency, args.duration))
+            if not latencies:
+                print(f'{url:<40} {concurrency:>7} {"no responses":>9}')
+                continue
+            p50 = statistics.median(latencies) * 1000
+            p99 = statistics.quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else p50
+            print(
+                f'{url:<40} {concurrency:>7} {len(latencies) / args.duration:>9,.0f} '
+                f'{p50:>8.1f} {p99:>8.1f} {len(errors):>6}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Latency of the password validation of a registration against the previous
+pipeline, and of the first registration of a fresh process.
+
+Previously the serializer matched its pattern string, Django's validators
+matched it again in ComplexPasswordValidator, and CommonPasswordValidator
+decompressed its list on the first use in each process. Now the pattern is
+precompiled and checked once, see users.validators, and the list is loaded
+into a frozenset at startup by UsersConfig.ready.
+
+Usage: python -m benchmarks.registration [--calls N] [--processes N] [--iterations N]
+
+Both pipelines are measured by this script, the previous one with Django's
+own CommonPasswordValidator, see legacy_validate(). Each list load is cold:
+the shared frozenset is dropped before every load, and its later uses are
+reported apart. The first POST /users/ is sent by ``--processes`` fresh
+processes for each pipeline; the previous one drops the validators loaded
+at startup, so that its first request loads them as it used to.
+
+The registrations are sent to the database of blogger.settings and rolled
+back. Their cost is mostly the password hashing, which ``--iterations``
+lowers.
+
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogger.settings')
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import hashers, password_validation  # noqa: E402
+from django.core.exceptions import ValidationError  # noqa: E402
+from django.db import transaction  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from users.validators import (CommonPasswordValidator, check_password_strength,  # noqa: E402
+                              load_common_passwords, run_other_validators)
+
+PASSWORDS = ('kjfrhU782', 'password1', 'short', 'Tr0ub4dor&3', 'correcthorse7')
+CALLS = 200
+LOAD_CALLS = 20
+PROCESSES = 5
+STOCK_VALIDATORS = [
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+    {'NAME': 'users.validators.ComplexPasswordValidator'},
+]
+
+
+def legacy_validate(validators, password):
+    if not re.match(r'^((?=.*?[0-9]).*).{8,}$', password):
+        raise ValidationError('weak', code='password_is_weak')
+    password_validation.validate_password(password, password_validators=validators)
+
+
+def validate(password):
+    check_password_strength(password)
+    run_other_validators(password)
+
+
+def load_cold():
+    load_common_passwords.cache_clear()
+    return CommonPasswordValidator()
+
+
+def measure(function, calls):
+    latencies = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def validate_all(validate_password):
+    for password in PASSWORDS:
+        try:
+            validate_password(password)
+        except ValidationError:
+            pass
+
+
+def register(client, n):
+    with transaction.atomic():
+        response = client.post(
+            '/users/',
+            {
+                'username': f'benchmark{n}',
+                'birthday': '1990-01-01',
+                'email': 'user@mail.ru',
+                'password': 'kjfrhU782',
+            },
+            content_type='application/json',
+        )
+        assert response.status_code == 201, response.content
+        transaction.set_rollback(True)
+
+
+def get_client(iterations):
+    if iterations:
+        hashers.get_hasher().iterations = iterations
+    settings.ALLOWED_HOSTS = [*settings.ALLOWED_HOSTS, 'testserver']
+    return Client()
+
+
+def first_request(legacy, iterations):
+    """Print the latency of the first registration of this process, in seconds."""
+    if legacy:
+        # the validators of the previous pipeline, loaded by the first request
+        settings.AUTH_PASSWORD_VALIDATORS = STOCK_VALIDATORS
+        password_validation.get_default_password_validators.cache_clear()
+    client = get_client(iterations)
+    print(measure(lambda: register(client, 0), 1)[0])
+
+
+def measure_first_requests(legacy, processes, iterations):
+    command = [sys.executable, '-m', 'benchmarks.registration', '--first-request']
+    if legacy:
+        command.append('--legacy')
+    if iterations:
+        command.append(f'--iterations={iterations}')
+    return [
+        float(subprocess.run(command, capture_output=True, check=True, text=True).stdout)
+        for _ in range(processes)
+    ]
+
+
+def report(name, latencies):
+    p50 = statistics.median(latencies) * 1000
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000 if len(latencies) > 1 else p50
+    print(f'{name:<48} {latencies[0] * 1000:>8.3f} {p50:>8.3f} {p99:>8.3f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--calls', type=int, default=CALLS)
+    parser.add_argument('--processes', type=int, default=PROCESSES)
+    parser.add_argument('--iterations', type=int, help='PBKDF2 iterations of the hashes')
+    parser.add_argument('--first-request', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--legacy', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.first_request:
+        first_request(args.legacy, args.iterations)
+        return
+
+    print(f'{"ms":<48} {"first":>8} {"p50":>8} {"p99":>8}')
+    report(
+        'before: load the common passwords',
+        measure(password_validation.CommonPasswordValidator, LOAD_CALLS),
+    )
+    report('after: load the common passwords', measure(load_cold, LOAD_CALLS))
+    report(
+        'after: reuse the loaded common passwords',
+        measure(CommonPasswordValidator, args.calls),
+    )
+
+    stock_validators = password_validation.get_password_validators(STOCK_VALIDATORS)
+    report(
+        f'before: validate {len(PASSWORDS)} passwords',
+        measure(lambda: validate_all(
+            lambda password: legacy_validate(stock_validators, password)
+        ), args.calls),
+    )
+    report(
+        f'after: validate {len(PASSWORDS)} passwords',
+        measure(lambda: validate_all(validate), args.calls),
+    )
+
+    report(
+        'before: first POST /users/ of a process',
+        measure_first_requests(True, args.processes, args.iterations),
+    )
+    report(
+        'after: first POST /users/ of a process',
+        measure_first_requests(False, args.processes, args.iterations),
+    )
+
+    client = get_client(args.iterations)
+    calls = iter(range(args.calls))
+    report('POST /users/', measure(lambda: register(client, next(calls)), args.calls))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.contrib.postgres.expressions import ArraySubquery
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import BooleanField, F, Func, Q, Value
+from django.db.models.functions import Upper
+from django.db.models.lookups import Contains
+from django.utils.functional import cached_property
+from django.utils.text import smart_split, unescape_string_literal
+
+
+def get_estimated_count(queryset):
+    """
+    Return the planner's estimate of the number of rows of the queryset's
+    table, or None if the queryset is filtered or the table has never been
+    analyzed.
+
+    """
+    query = queryset.query
+    if query.where or query.distinct or query.combinator or query.is_sliced:
+        return None
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # reltuples is -1 until the table is first vacuumed or analyzed
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator taking the count of an unfiltered changelist from
+    ``pg_class.reltuples`` instead of running ``COUNT(*)`` over the table.
+
+    The estimate is refreshed by autovacuum and ANALYZE and can be off by a
+    few percent, so it is only used for tables of at least
+    ``ESTIMATED_COUNT_THRESHOLD`` rows. Filtered and searched changelists
+    are counted exactly.
+
+    """
+
+    @cached_property
+    def count(self):
+        if hasattr(self.object_list, 'query'):
+            estimate = get_estimated_count(self.object_list)
+            if estimate is not None and estimate >= settings.ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class EqualsAny(Func):
+    """``<expression> = ANY(<array>)``"""
+    arg_joiner = ' = ANY('
+    template = '%(expressions)s)'
+    output_field = BooleanField()
+
+
+class TrigramSearchMixin:
+    """
+    Admin search served by the ``gin_trgm_ops`` indexes over
+    ``UPPER(<column>)`` of the ``search_fields``.
+
+    Every word of the search term must be contained, case-insensitively, in
+    one of the fields. The condition is written as ``UPPER(column) LIKE
+    '%WORD%'`` to match the expression of the indexes, and the fields of a
+    related model (``author__username``) are searched in an array subquery on
+    that model, which is run once before the main query, so that the planner
+    can combine the indexes of both tables instead of scanning their join.
+    Only fields of the model and of the models it references by a foreign key
+    are supported.
+
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        search_fields = self.get_search_fields(request)
+        if not search_fields:
+            return queryset, False
+        for word in smart_split(search_term):
+            if word.startswith(('"', "'")) and word[0] == word[-1]:
+                word = unescape_string_literal(word)
+            queryset = queryset.filter(
+                self.get_search_filter(queryset.model, search_fields, word)
+            )
+        return queryset, False
+
+    def get_search_filter(self, model, search_fields, word):
+        search_filter, related_filters = Q(), {}
+        for field_name in search_fields:
+            relation, _, column = field_name.rpartition('__')
+            condition = Q(Contains(Upper(column), Upper(Value(word))))
+            if relation:
+                related_filters[relation] = related_filters.get(relation, Q()) | condition
+            else:
+                search_filter |= condition
+        for relation, condition in related_filters.items():
+            related_model = model._meta.get_field(relation).related_model
+            search_filter |= Q(EqualsAny(
+                F(relation),
+                ArraySubquery(related_model._default_manager.filter(condition).values('pk')),
+            ))
+        return search_filter
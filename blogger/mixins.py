@@ -0,0 +1,196 @@
+from hashlib import md5
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError as APIValidationError
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ConditionalGetMixin:
+    """
+    Answer ``list`` and ``retrieve`` with 304 Not Modified when the client's
+    If-None-Match / If-Modified-Since validators still match.
+
+    The validators are computed from a single query over the primary key,
+    ``last_modified_field`` and ``etag_fields`` columns of the requested page
+    or object, before anything is serialized. The ETag hashes these columns
+    of every row, so it also changes when a row leaves or joins the page.
+    Unpaginated lists without ``etag_fields`` hash the row count and the
+    latest ``last_modified_field`` of the whole list instead, read by one
+    aggregate query.
+    Last-Modified, the ``last_modified_field`` value, is only sent for
+    single objects: the latest value of a page does not change when a row
+    is deleted from it, so lists are validated by their ETag alone.
+
+    """
+    last_modified_field = 'updated'
+    etag_fields = ()
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        columns = self.get_validator_columns()
+        if self.paginator is not None:
+            ordering = [field.lstrip('-') for field in getattr(self.paginator, 'ordering', ())]
+            rows = self.paginate_queryset(
+                queryset.prefetch_related(None).only(*columns, *ordering)
+            )
+            rows = [[getattr(row, column) for column in columns] for row in rows]
+        elif not self.etag_fields:
+            # any change saves a later value, any deletion lowers the count
+            rows = [tuple(queryset.aggregate(
+                Count('pk'), Max(self.last_modified_field)
+            ).values())]
+        else:
+            rows = list(queryset.prefetch_related(None).values_list(*columns))
+        return self.conditional_response(
+            rows, super().list, request, *args, with_last_modified=False, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None)
+        try:
+            rows = list(
+                queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]})
+                .values_list(*self.get_validator_columns())
+            )
+        except (TypeError, ValueError, ValidationError):
+            rows = []
+        if not rows:
+            return super().retrieve(request, *args, **kwargs)
+        return self.conditional_response(rows, super().retrieve, request, *args, **kwargs)
+
+    def get_validator_columns(self):
+        return ['pk', self.last_modified_field, *self.etag_fields]
+
+    def conditional_response(self, rows, action, request, *args,
+                             with_last_modified=True, **kwargs):
+        etag = quote_etag(md5(repr(rows).encode()).hexdigest())
+        modified = [row[1] for row in rows if row[1] is not None]
+        last_modified = None
+        if with_last_modified and modified:
+            last_modified = int(max(modified).timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = action(request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class SerializerColumnsMixin:
+    """
+    Load only the columns the serializer of a read action renders.
+
+    For the actions in ``serializer_columns_actions`` the queryset is
+    restricted with ``only()`` to the primary key and the model fields read
+    by the serializer, so unused columns such as the password hash are never
+    fetched. Write actions keep every column: saving an instance with
+    deferred fields would skip them, ``auto_now`` fields included.
+
+    """
+    serializer_columns_actions = ('list', 'retrieve')
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in self.serializer_columns_actions:
+            queryset = queryset.only(*self.get_serializer_columns(queryset.model))
+        return queryset
+
+    def get_serializer_columns(self, model):
+        model_fields = {field.name for field in model._meta.concrete_fields}
+        return ['pk', *(
+            field.source for field in self.get_serializer().fields.values()
+            if not field.write_only and field.source in model_fields
+        )]
+
+
+class BulkCreateMixin:
+    """
+    Add a ``POST <prefix>/bulk/`` action creating a list of objects at once.
+
+    The items are validated together by the ``many=True`` form of the create
+    serializer, which reports the errors of each item at its index, and are
+    saved by its list serializer in a single transaction. Nothing is created
+    unless every item is valid.
+
+    """
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            max_length=settings.BULK_CREATE_MAX_SIZE,
+        )
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            self.perform_bulk_create(serializer)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def perform_bulk_create(self, serializer):
+        serializer.save()
+
+
+class StreamingListMixin:
+    """
+    Stream the whole filtered list with ``?stream=json`` or ``?stream=ndjson``.
+
+    The queryset is read through a server-side cursor in chunks of
+    ``stream_chunk_size`` rows, and every row is serialized and sent as soon
+    as it is read, so the memory used does not depend on the size of the
+    table. Streamed lists are not paginated. Place the mixin before the
+    mixins caching ``list``, since a stream cannot be cached.
+
+    """
+    stream_chunk_size = 2000
+    stream_formats = {
+        'json': 'application/json',
+        'ndjson': 'application/x-ndjson',
+    }
+
+    def list(self, request, *args, **kwargs):
+        stream_format = request.query_params.get('stream')
+        if stream_format is None:
+            return super().list(request, *args, **kwargs)
+        if stream_format not in self.stream_formats:
+            raise APIValidationError(
+                {'stream': f"Допустимые значения: {', '.join(self.stream_formats)}"}
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream_rows(queryset, stream_format),
+            content_type=self.stream_formats[stream_format],
+        )
+
+    def stream_rows(self, queryset, stream_format):
+        serializer = self.get_serializer()
+        encoder = JSONEncoder(ensure_ascii=False)
+        rows = (
+            encoder.encode(serializer.to_representation(instance))
+            for instance in queryset.iterator(chunk_size=self.stream_chunk_size)
+        )
+        if stream_format == 'ndjson':
+            for row in rows:
+                yield f'{row}\n'
+            return
+
+        yield '['
+        for index, row in enumerate(rows):
+            yield f',{row}' if index else row
+        yield ']'
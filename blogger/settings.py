@@ -23,6 +23,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'phonenumber_field',
     'rest_framework_simplejwt',
     'rest_framework',
@@ -71,18 +72,72 @@ DATABASES = {
     }
 }
 
+# Redis in production, a process-local cache in development and tests
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+BULK_CREATE_MAX_SIZE = 500
+BULK_DELETE_MAX_SIZE = 10000
+# uploads are streamed to temporary files and limited in size
+FILE_UPLOAD_HANDLERS = ['blogger.uploads.SizeLimitedUploadHandler']
+FILE_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+IMAGE_ALLOWED_FORMATS = ('JPEG', 'PNG', 'WEBP', 'GIF')
+IMAGE_MAX_PIXELS = 40_000_000
+# shared media files modified more recently are never garbage-collected
+MEDIA_GC_MIN_AGE = 60 * 60
+# post image renditions, see posts.images; AVIF needs pillow-avif-plugin
+POST_IMAGE_RENDITION_WIDTHS = (320, 640, 1280)
+POST_IMAGE_RENDITION_FORMATS = ('webp', 'avif')
+POST_IMAGE_QUALITY = 80
+# threads creating the renditions, 0 creates them in the request
+POST_IMAGE_WORKERS = 2
+# precompute the feeds on write instead of merging the followed authors'
+# posts on read, see posts.feed; backfill with manage.py rebuild_timelines
+FEED_FANOUT_ON_WRITE = False
+# admin changelists of larger tables show the planner's row count estimate
+ESTIMATED_COUNT_THRESHOLD = 10000
+
 AUTH_USER_MODEL = 'users.User'
 USER_MIN_AGE = 18
 ALLOWED_EMAIL_DOMAINS = ['mail.ru', 'yandex.ru']
-FORBIDDEN_WORDS = ['ерунда', 'глупость', 'чепуха']
+# how often workers check for changes of the posts.ForbiddenWord words
+FORBIDDEN_WORDS_CHECK_INTERVAL = 5
+# users kept by each worker for users.authentication.CachedJWTAuthentication
+# and users.backends.CachedModelBackend, see users.cache
+USER_CACHE_SIZE = 1024
+# the seconds a cached user is kept, which bounds how long the workers
+# miss the changes of the others without a shared cache
+USER_CACHE_MAX_AGE = 60
+# the processes hashing the passwords of POST /users/bulk/, in the worker
+# itself if 0; the PBKDF2 iterations of these hashes, the default if None
+PASSWORD_HASHING_WORKERS = 0
+PASSWORD_HASHING_ITERATIONS = None
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "users.authentication.ClaimsJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
 }
 
+# the access tokens carry the user fields read by the permissions,
+# see users.authentication
+SIMPLE_JWT = {
+    "TOKEN_OBTAIN_SERIALIZER": "users.serializers.ClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.ClaimsTokenRefreshSerializer",
+}
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -91,7 +146,7 @@ AUTH_PASSWORD_VALIDATORS = [
         'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
     },
     {
-        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+        'NAME': 'users.validators.CommonPasswordValidator',
     },
     {
         'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
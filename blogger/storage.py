@@ -0,0 +1,69 @@
+import hashlib
+import os
+import posixpath
+import tempfile
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage keeping each distinct content once, under its digest.
+
+    A file saved as ``<dir>/<name>.<ext>`` is stored as
+    ``<dir>/<ab>/<cd>/<sha256>.<ext>``. Saving a content that is already
+    stored returns the existing name without writing anything, so the same
+    image uploaded many times takes the disk space of one copy and keeps a
+    single, immutable URL. The digest of an upload is computed while it is
+    received by blogger.uploads.SizeLimitedUploadHandler, other contents
+    are hashed when saved.
+
+    Files are shared, so they must not be deleted while any row still
+    references them, see posts.images.delete_unreferenced_image.
+
+    """
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, 'chunks'):
+            content = File(content, name)
+        name = self.get_content_name(name, content)
+        try:
+            # mark the file as in use again, see posts.images
+            os.utime(self.path(name))
+        except FileNotFoundError:
+            name = self._save(name, content)
+        return name
+
+    def get_content_name(self, name, content):
+        digest = getattr(content, 'sha256', None)
+        if digest is None:
+            sha256 = hashlib.sha256()
+            for chunk in content.chunks():
+                sha256.update(chunk)
+            digest = sha256.hexdigest()
+        directory = posixpath.dirname(name.replace('\\', '/'))
+        extension = os.path.splitext(name)[1].lower()
+        return posixpath.join(directory, digest[:2], digest[2:4], f'{digest}{extension}')
+
+    def _save(self, name, content):
+        # Write to a temporary file and rename it over the target, so that
+        # concurrent saves of the same content leave one complete file.
+        full_path = self.path(name)
+        directory = os.path.dirname(full_path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=directory, prefix='.upload-')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                for chunk in content.chunks():
+                    file.write(chunk)
+            if self.file_permissions_mode is not None:
+                os.chmod(temporary_path, self.file_permissions_mode)
+            os.replace(temporary_path, full_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        return name
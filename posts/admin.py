@@ -2,10 +2,12 @@ from django.contrib import admin
 from django.urls import reverse
 from django.utils.html import format_html
 
-from posts.models import Post, Comment
+from blogger.admin import EstimatedCountPaginator, TrigramSearchMixin
+from posts.images import schedule_image_gc, schedule_renditions
+from posts.models import Post, Comment, ForbiddenWord
 
 
-class PostAdmin(admin.ModelAdmin):
+class PostAdmin(TrigramSearchMixin, admin.ModelAdmin):
     list_filter = ('created',)
     list_display = (
         'id',
@@ -18,14 +20,35 @@ class PostAdmin(admin.ModelAdmin):
     )
     search_fields = ('title', 'text', 'author__username')
     list_display_links = ('id',)
+    list_select_related = ('author',)
+    date_hierarchy = 'created'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('search_vector')
+
+    def save_model(self, request, obj, form, change):
+        if 'image' not in form.changed_data:
+            return super().save_model(request, obj, form, change)
+        if change:
+            old = Post.objects.only(
+                'image', 'image_width', 'image_height', 'image_renditions'
+            ).get(pk=obj.pk)
+            schedule_image_gc(old.image.name, old.image_renditions)
+        super().save_model(request, obj, form, change)
+        if change:
+            # Post.save() never writes the renditions, see db_maintained_fields
+            Post.objects.filter(pk=obj.pk).update(image_renditions=[])
+            obj.image_renditions = []
+        schedule_renditions(obj)
 
     def author_link(self, obj):
-        author = obj.author
-        url = reverse('admin:users_user_changelist') + str(author.id)
-        return format_html(f'<a href="{url}">{author}</a>')
+        url = reverse('admin:users_user_changelist') + str(obj.author_id)
+        return format_html(f'<a href="{url}">{obj.author}</a>')
 
 
-class CommentAdmin(admin.ModelAdmin):
+class CommentAdmin(TrigramSearchMixin, admin.ModelAdmin):
     list_filter = ('created',)
     list_display = (
         'id',
@@ -35,14 +58,27 @@ class CommentAdmin(admin.ModelAdmin):
         'created',
         'updated',
     )
-    search_fields = ('title', 'text', 'author__username')
+    search_fields = ('text', 'author__username')
     list_display_links = ('id',)
+    list_select_related = ('author',)
+    date_hierarchy = 'created'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('search_vector')
 
     def author_link(self, obj):
-        author = obj.author
-        url = reverse('admin:users_user_changelist') + str(author.id)
-        return format_html(f'<a href="{url}">{author}</a>')
+        url = reverse('admin:users_user_changelist') + str(obj.author_id)
+        return format_html(f'<a href="{url}">{obj.author}</a>')
+
+
+class ForbiddenWordAdmin(admin.ModelAdmin):
+    list_display = ('id', 'word')
+    search_fields = ('word',)
+    list_display_links = ('id',)
 
 
 admin.site.register(Post, PostAdmin)
 admin.site.register(Comment, CommentAdmin)
+admin.site.register(ForbiddenWord, ForbiddenWordAdmin)
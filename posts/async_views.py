@@ -0,0 +1,106 @@
+"""
+Read-only views of posts and comments served on the event loop.
+
+They mirror the list and retrieve actions of the viewsets in posts.views,
+with the same serializers, filters and keyset pagination, but await the
+database through the async ORM interface (``aget()``, ``async for``). On
+Django 4.1 that interface still runs the sync ORM through
+``sync_to_async(thread_sensitive=True)``, so the queries of all the
+requests of a process are serialized on one shared thread; only the rest
+of the request is handled concurrently on the event loop. The comment ids
+of a post are selected with the post by an ARRAY subquery, since
+prefetch_related() is not available to async iteration.
+
+"""
+from functools import wraps
+
+from django.contrib.postgres.expressions import ArraySubquery
+from django.db.models import OuterRef
+from django.http import HttpResponseNotAllowed, JsonResponse
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from .models import Post, Comment
+from .pagination import KeysetCursorPagination
+from .serializers import AsyncPostDetailSerializer, CommentDetailSerializer
+
+
+def async_read_view(view):
+    """Run an async view returning data as a JSON API GET endpoint."""
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        request = Request(request)
+        try:
+            data = await view(request, *args, **kwargs)
+        except APIException as exc:
+            return JsonResponse({'detail': exc.detail}, status=exc.status_code)
+        # rendered like the compact, unicode output of DRF's JSONRenderer
+        return JsonResponse(
+            data,
+            encoder=JSONEncoder,
+            json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+        )
+
+    return wrapper
+
+
+async def get_page(request, queryset, serializer_class):
+    paginator = KeysetCursorPagination()
+    page = await paginator.apaginate_queryset(queryset, request)
+    serializer = serializer_class(page, many=True, context={'request': request})
+    return {
+        'next': paginator.get_next_link(),
+        'previous': paginator.get_previous_link(),
+        'results': serializer.data,
+    }
+
+
+async def get_object(queryset, pk):
+    try:
+        return await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        raise NotFound
+
+
+def get_post_queryset():
+    return Post.objects.defer('search_vector').annotate(
+        comment_ids=ArraySubquery(
+            Comment.objects.filter(post=OuterRef('pk'))
+            .order_by(*Comment._meta.ordering)
+            .values('id')
+        )
+    )
+
+
+@async_read_view
+async def post_list(request):
+    queryset = get_post_queryset()
+    user = request.query_params.get('user')
+    if user:
+        queryset = queryset.filter(author=user)
+    return await get_page(request, queryset, AsyncPostDetailSerializer)
+
+
+@async_read_view
+async def post_detail(request, pk):
+    post = await get_object(get_post_queryset(), pk)
+    return AsyncPostDetailSerializer(post, context={'request': request}).data
+
+
+@async_read_view
+async def comment_list(request):
+    queryset = Comment.objects.defer('search_vector')
+    post = request.query_params.get('post')
+    if post:
+        queryset = queryset.filter(post=post)
+    return await get_page(request, queryset, CommentDetailSerializer)
+
+
+@async_read_view
+async def comment_detail(request, pk):
+    comment = await get_object(Comment.objects.defer('search_vector'), pk)
+    return CommentDetailSerializer(comment, context={'request': request}).data
@@ -0,0 +1,122 @@
+import threading
+import time
+from hashlib import md5
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+VERSION_KEY = 'posts:version:{}'
+RESPONSE_KEY = 'posts:response:{}'
+
+_last_version = 0
+_version_lock = threading.Lock()
+
+
+def get_versions(*names) -> list:
+    """
+    Return the current version of each cache namespace.
+
+    A missing version (never set or evicted) is initialised with a timestamp,
+    like the versions set by bump_versions, so it never collides with a
+    version used by entries cached before.
+
+    """
+    keys = [VERSION_KEY.format(name) for name in names]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, new_version(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def new_version() -> int:
+    """A timestamp greater than every version set by this process."""
+    global _last_version
+    with _version_lock:
+        _last_version = max(time.time_ns(), _last_version + 1)
+        return _last_version
+
+
+def bump_versions(*names):
+    """
+    Invalidate every response cached under the given namespaces.
+
+    They all get a new timestamp version with a single set_many(), so the
+    namespaces of thousands of objects are bumped in one cache round trip.
+
+    """
+    if names:
+        version = new_version()
+        cache.set_many({VERSION_KEY.format(name): version for name in names}, timeout=None)
+
+
+def invalidate_post(pk):
+    bump_versions('post-list', f'post-{pk}')
+
+
+def invalidate_comment(pk, post_pk):
+    # a comment is part of the representation of its post
+    bump_versions('comment-list', f'comment-{pk}', 'post-list', f'post-{post_pk}')
+
+
+class CachedReadMixin:
+    """
+    Serve anonymous ``list`` and ``retrieve`` responses from the cache.
+
+    Entries are keyed by the request path and the versions of the namespaces
+    they depend on: ``<cache_namespace>-list`` for lists and
+    ``<cache_namespace>-<pk>`` for single objects. The post_save/post_delete
+    receivers in posts.signals bump these versions, which invalidates the
+    affected entries without waiting for the timeout.
+
+    The ETag and Last-Modified headers of the response are cached with it,
+    so place the mixin before ConditionalGetMixin to serve cached conditional
+    requests without any query.
+
+    """
+    cache_namespace = None
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(
+            super().list, [f'{self.cache_namespace}-list'], request, *args, **kwargs
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        pk = kwargs[self.lookup_url_kwarg or self.lookup_field]
+        return self.cached_response(
+            super().retrieve, [f'{self.cache_namespace}-{pk}'], request, *args, **kwargs
+        )
+
+    def cached_response(self, action, namespaces, request, *args, **kwargs):
+        if not request.user.is_anonymous:
+            return action(request, *args, **kwargs)
+
+        versions = get_versions(*namespaces)
+        digest = md5(f'{versions}:{request.get_full_path()}'.encode()).hexdigest()
+        key = RESPONSE_KEY.format(digest)
+        entry = cache.get(key)
+        if entry is None:
+            response = action(request, *args, **kwargs)
+            if response.status_code == 200:
+                headers = {
+                    header: response[header]
+                    for header in ('ETag', 'Last-Modified') if header in response
+                }
+                cache.set(
+                    key,
+                    {'data': response.data, 'headers': headers},
+                    settings.RESPONSE_CACHE_TIMEOUT,
+                )
+            return response
+
+        response = Response(entry['data'], headers=entry['headers'])
+        return get_conditional_response(
+            request,
+            etag=entry['headers'].get('ETag'),
+            last_modified=parse_http_date_safe(entry['headers'].get('Last-Modified')),
+            response=response,
+        )
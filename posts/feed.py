@@ -0,0 +1,111 @@
+from django.conf import settings
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+from users.models import Follow
+from .models import Post, TimelineEntry
+from .pagination import KeysetCursorPagination
+
+# For every followed author, the next page of their posts is read from the
+# (author_id, -created, -id) index; the pages are then merged and cut to a
+# single page, so no more than (followed authors + 1) * page rows are read.
+MERGE_SQL = """
+SELECT page.id FROM {follow} AS follow
+CROSS JOIN LATERAL (
+    SELECT post.id, post.created FROM {post} AS post
+    WHERE post.author_id = follow.author_id {keyset}
+    ORDER BY post.created {direction}, post.id {direction}
+    LIMIT %s
+) AS page
+WHERE follow.follower_id = %s
+ORDER BY page.created {direction}, page.id {direction}
+LIMIT %s
+"""
+
+TIMELINE_SQL = """
+SELECT timeline.post_id FROM {timeline} AS timeline
+WHERE timeline.user_id = %s {keyset}
+ORDER BY timeline.created {direction}, timeline.post_id {direction}
+LIMIT %s
+"""
+
+FAN_OUT_SQL = """
+INSERT INTO {timeline} (user_id, post_id, created)
+SELECT follow.follower_id, post.id, post.created
+FROM {post} AS post JOIN {follow} AS follow ON follow.author_id = post.author_id
+WHERE {condition}
+ON CONFLICT DO NOTHING
+"""
+
+
+class FeedPagination(KeysetCursorPagination):
+    """
+    Keyset pagination of the posts of the authors the request user follows.
+
+    The ids of a page are selected by a raw query, either merging the pages
+    of the followed authors or, with ``FEED_FANOUT_ON_WRITE``, reading the
+    timeline precomputed on write, and the posts are then loaded by primary
+    key. Neither query scans the posts of other authors.
+
+    """
+
+    def get_page_queryset(self, queryset, position, reverse):
+        direction, operator = ('ASC', '>') if reverse else ('DESC', '<')
+        keyset, params = '', []
+        if position is not None:
+            keyset = f'AND ({{created}}, {{id}}) {operator} (%s, %s)'
+            params = self._parse_position(queryset, position)
+        limit = self.page_size + 1
+
+        if settings.FEED_FANOUT_ON_WRITE:
+            sql = TIMELINE_SQL.format(
+                timeline=TimelineEntry._meta.db_table,
+                keyset=keyset.format(created='timeline.created', id='timeline.post_id'),
+                direction=direction,
+            )
+            params = [self.request.user.id, *params, limit]
+        else:
+            sql = MERGE_SQL.format(
+                follow=Follow._meta.db_table,
+                post=Post._meta.db_table,
+                keyset=keyset.format(created='post.created', id='post.id'),
+                direction=direction,
+            )
+            params = [*params, limit, self.request.user.id, limit]
+
+        queryset = queryset.filter(pk__in=RawSQL(sql, params))
+        return super().get_page_queryset(queryset, None, reverse)
+
+
+def fan_out(condition, params):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            FAN_OUT_SQL.format(
+                timeline=TimelineEntry._meta.db_table,
+                post=Post._meta.db_table,
+                follow=Follow._meta.db_table,
+                condition=condition,
+            ),
+            params,
+        )
+
+
+def add_to_timelines(post_ids):
+    """Add new posts to the timelines of their authors' followers."""
+    if settings.FEED_FANOUT_ON_WRITE and post_ids:
+        fan_out('post.id = ANY(%s)', [list(post_ids)])
+
+
+def follow_timeline(follower_id, author_id):
+    """Add the posts of a newly followed author to the follower's timeline."""
+    if settings.FEED_FANOUT_ON_WRITE:
+        fan_out(
+            'follow.follower_id = %s AND follow.author_id = %s',
+            [follower_id, author_id],
+        )
+
+
+def unfollow_timeline(follower_id, author_id):
+    """Remove the posts of an unfollowed author from the follower's timeline."""
+    if settings.FEED_FANOUT_ON_WRITE:
+        TimelineEntry.objects.filter(user=follower_id, post__author=author_id).delete()
@@ -0,0 +1,162 @@
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+from PIL import Image, ImageOps
+
+from .cache import invalidate_post
+from .models import Post
+
+try:
+    # registers the AVIF codec with Pillow when the plugin is installed
+    import pillow_avif  # noqa: F401
+except ImportError:
+    pass
+
+logger = logging.getLogger(__name__)
+
+RENDITIONS_DIR = 'posts/renditions/'
+
+_executor = None
+
+
+def get_rendition_formats() -> list:
+    """The configured rendition formats Pillow can encode."""
+    # the encoders are registered on the first use of Pillow
+    Image.init()
+    return [
+        image_format for image_format in settings.POST_IMAGE_RENDITION_FORMATS
+        if image_format.upper() in Image.SAVE
+    ]
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.POST_IMAGE_WORKERS,
+            thread_name_prefix='post-images',
+        )
+    return _executor
+
+
+def schedule_renditions(post):
+    """
+    Create the renditions of the post image once the current transaction
+    commits, in the worker pool, or in place if ``POST_IMAGE_WORKERS`` is 0.
+
+    """
+    if not post.image:
+        return
+    args = (post.pk, post.image.name)
+    if settings.POST_IMAGE_WORKERS:
+        transaction.on_commit(lambda: get_executor().submit(_create_in_worker, *args))
+    else:
+        transaction.on_commit(lambda: create_renditions(*args))
+
+
+def _create_in_worker(post_id, image_name):
+    try:
+        create_renditions(post_id, image_name)
+    except Exception:
+        logger.exception('Could not create the renditions of %s', image_name)
+    finally:
+        # the pool threads are not closed by the request cycle
+        connection.close()
+
+
+def create_renditions(post_id, image_name):
+    """
+    Save the post image downscaled to each of ``POST_IMAGE_RENDITION_WIDTHS``
+    narrower than the original, in each of the rendition formats, and list
+    them in ``Post.image_renditions``.
+
+    The EXIF orientation is applied to the pixels and the metadata is not
+    copied to the renditions. Nothing is saved if the post was deleted or its
+    image replaced in the meantime, the later upload has its own task.
+
+    """
+    post = (
+        Post.objects.filter(pk=post_id, image=image_name)
+        .only('id', 'image', 'image_width', 'image_height')
+        .first()
+    )
+    if post is None:
+        return
+
+    with post.image.open('rb') as file, Image.open(file) as original:
+        original = ImageOps.exif_transpose(original)
+        if original.mode not in ('RGB', 'RGBA'):
+            has_alpha = 'A' in original.getbands() or 'transparency' in original.info
+            original = original.convert('RGBA' if has_alpha else 'RGB')
+        widths = [
+            width for width in settings.POST_IMAGE_RENDITION_WIDTHS
+            if width < original.width
+        ] or [original.width]
+
+        base = os.path.splitext(os.path.basename(image_name))[0]
+        renditions = []
+        for width in widths:
+            height = max(1, round(original.height * width / original.width))
+            resized = original.resize((width, height), Image.Resampling.LANCZOS)
+            for image_format in get_rendition_formats():
+                buffer = BytesIO()
+                resized.save(
+                    buffer, image_format.upper(), quality=settings.POST_IMAGE_QUALITY
+                )
+                name = post.image.storage.save(
+                    f'{RENDITIONS_DIR}{base}_{width}.{image_format}',
+                    ContentFile(buffer.getvalue()),
+                )
+                renditions.append({
+                    'format': image_format,
+                    'width': width,
+                    'height': height,
+                    'name': name,
+                })
+
+    # the renditions are part of the ETag of the post, see PostViewSet
+    updated = Post.objects.filter(pk=post_id, image=image_name).update(
+        image_renditions=renditions
+    )
+    if updated:
+        invalidate_post(post_id)
+
+
+def schedule_image_gc(image_name, renditions):
+    """Delete the files of a dropped image once the transaction commits."""
+    if image_name:
+        transaction.on_commit(lambda: delete_unreferenced_image(image_name, renditions))
+
+
+def delete_unreferenced_image(image_name, renditions):
+    """
+    Delete an image and its renditions if no post references the image.
+
+    The files are shared by every post with the same content, see
+    blogger.storage.ContentAddressedStorage, so the posts referencing the
+    image are its reference count. Saving an existing content touches the
+    file, and files modified less than ``MEDIA_GC_MIN_AGE`` seconds ago are
+    kept, since a post uploading the same image may not be committed yet;
+    manage.py gc_post_images collects them later.
+
+    """
+    if Post.objects.filter(image=image_name).exists():
+        return
+    storage = Post._meta.get_field('image').storage
+    for name in [image_name, *(rendition['name'] for rendition in renditions)]:
+        if is_collectable(storage, name):
+            storage.delete(name)
+
+
+def is_collectable(storage, name) -> bool:
+    try:
+        modified = storage.get_modified_time(name).timestamp()
+    except FileNotFoundError:
+        return False
+    return time.time() - modified >= settings.MEDIA_GC_MIN_AGE
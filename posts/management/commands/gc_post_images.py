@@ -0,0 +1,50 @@
+import posixpath
+
+from django.core.management.base import BaseCommand
+
+from posts.images import is_collectable
+from posts.models import Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the post image files no post references, "
+        "older than MEDIA_GC_MIN_AGE seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only list the files that would be deleted.',
+        )
+
+    def handle(self, *args, dry_run, **options):
+        storage = Post._meta.get_field('image').storage
+        referenced = set()
+        posts = Post.objects.exclude(image='').values_list('image', 'image_renditions')
+        for image, renditions in posts.iterator():
+            referenced.add(image)
+            referenced.update(rendition['name'] for rendition in renditions)
+
+        deleted = 0
+        for name in self.walk(storage, 'posts'):
+            if name in referenced or not is_collectable(storage, name):
+                continue
+            if dry_run:
+                self.stdout.write(name)
+            else:
+                storage.delete(name)
+            deleted += 1
+
+        action = 'Would delete' if dry_run else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(f'{action} {deleted} unreferenced files.'))
+
+    def walk(self, storage, directory):
+        if not storage.exists(directory):
+            return
+        directories, files = storage.listdir(directory)
+        for name in files:
+            yield posixpath.join(directory, name)
+        for name in directories:
+            yield from self.walk(storage, posixpath.join(directory, name))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from posts.models import Post, Comment
+
+
+class Command(BaseCommand):
+    help = "Rebuild Post.comment_count and Post.last_commented_at from the comments table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Number of posts updated per transaction.',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        comments = Comment.objects.filter(post=OuterRef('pk')).order_by().values('post')
+        count = Subquery(
+            comments.annotate(cnt=Count('pk')).values('cnt'),
+            output_field=IntegerField(),
+        )
+        last_created = Subquery(comments.annotate(last=Max('created')).values('last'))
+
+        last_id = 0
+        updated = 0
+        while True:
+            ids = list(
+                Post.objects.filter(pk__gt=last_id)
+                .order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                updated += Post.objects.filter(pk__in=ids).update(
+                    comment_count=Coalesce(count, 0),
+                    last_commented_at=last_created,
+                )
+            last_id = ids[-1]
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt counters of {updated} posts.'))
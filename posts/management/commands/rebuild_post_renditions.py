@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from posts.images import create_renditions
+from posts.models import Post
+
+
+class Command(BaseCommand):
+    help = "Store the dimensions and create the renditions of the images of existing posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Also recreate the renditions of posts that already have them.',
+        )
+
+    def handle(self, *args, all, **options):
+        posts = Post.objects.exclude(image='').only('id', 'image', 'image_width', 'image_height')
+        if not all:
+            posts = posts.filter(image_renditions=[])
+
+        created = 0
+        for post in posts.iterator():
+            # ImageField fills missing dimensions from the file when loading the post
+            Post.objects.filter(pk=post.pk).update(
+                image_width=post.image_width, image_height=post.image_height
+            )
+            try:
+                create_renditions(post.pk, post.image.name)
+            except OSError as exc:
+                self.stderr.write(f'Post {post.pk}: {exc}')
+                continue
+            created += 1
+
+        self.stdout.write(self.style.SUCCESS(f'Created the renditions of {created} posts.'))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from posts.feed import fan_out
+from posts.models import TimelineEntry
+from users.models import Follow
+
+
+class Command(BaseCommand):
+    help = "Rebuild the feeds precomputed with FEED_FANOUT_ON_WRITE from the follows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of followers whose feeds are rebuilt per transaction.',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        follower_ids = list(
+            Follow.objects.order_by('follower').values_list('follower', flat=True).distinct()
+        )
+        for start in range(0, len(follower_ids), batch_size):
+            batch = follower_ids[start:start + batch_size]
+            with transaction.atomic():
+                TimelineEntry.objects.filter(user__in=batch).delete()
+                fan_out('follow.follower_id = ANY(%s)', [batch])
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Rebuilt the feeds of {len(follower_ids)} users.')
+        )
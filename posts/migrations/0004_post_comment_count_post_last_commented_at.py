@@ -0,0 +1,116 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:29
+
+from django.db import migrations, models
+
+CREATE_TRIGGERS = """
+CREATE FUNCTION posts_comment_counters_insert() RETURNS trigger AS $$
+BEGIN
+    UPDATE posts_post AS p
+    SET comment_count = p.comment_count + n.cnt,
+        last_commented_at = GREATEST(p.last_commented_at, n.last_created)
+    FROM (
+        SELECT post_id, count(*) AS cnt, max(created) AS last_created
+        FROM new_comments GROUP BY post_id
+    ) AS n
+    WHERE p.id = n.post_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION posts_comment_counters_delete() RETURNS trigger AS $$
+BEGIN
+    UPDATE posts_post AS p
+    SET comment_count = p.comment_count - o.cnt,
+        last_commented_at = (
+            SELECT max(c.created) FROM posts_comment AS c WHERE c.post_id = p.id
+        )
+    FROM (
+        SELECT post_id, count(*) AS cnt FROM old_comments GROUP BY post_id
+    ) AS o
+    WHERE p.id = o.post_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION posts_comment_counters_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE posts_post AS p
+    SET comment_count = (
+            SELECT count(*) FROM posts_comment AS c WHERE c.post_id = p.id
+        ),
+        last_commented_at = (
+            SELECT max(c.created) FROM posts_comment AS c WHERE c.post_id = p.id
+        )
+    WHERE p.id IN (
+        SELECT o.post_id FROM old_comments AS o
+        JOIN new_comments AS n ON n.id = o.id
+        WHERE n.post_id <> o.post_id OR n.created <> o.created
+        UNION
+        SELECT n.post_id FROM old_comments AS o
+        JOIN new_comments AS n ON n.id = o.id
+        WHERE n.post_id <> o.post_id OR n.created <> o.created
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_comment_counters_insert
+AFTER INSERT ON posts_comment
+REFERENCING NEW TABLE AS new_comments
+FOR EACH STATEMENT EXECUTE FUNCTION posts_comment_counters_insert();
+
+CREATE TRIGGER posts_comment_counters_delete
+AFTER DELETE ON posts_comment
+REFERENCING OLD TABLE AS old_comments
+FOR EACH STATEMENT EXECUTE FUNCTION posts_comment_counters_delete();
+
+CREATE TRIGGER posts_comment_counters_update
+AFTER UPDATE ON posts_comment
+REFERENCING OLD TABLE AS old_comments NEW TABLE AS new_comments
+FOR EACH STATEMENT EXECUTE FUNCTION posts_comment_counters_update();
+
+UPDATE posts_post AS p
+SET comment_count = c.cnt, last_commented_at = c.last_created
+FROM (
+    SELECT post_id, count(*) AS cnt, max(created) AS last_created
+    FROM posts_comment GROUP BY post_id
+) AS c
+WHERE p.id = c.post_id;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER posts_comment_counters_insert ON posts_comment;
+DROP TRIGGER posts_comment_counters_delete ON posts_comment;
+DROP TRIGGER posts_comment_counters_update ON posts_comment;
+DROP FUNCTION posts_comment_counters_insert();
+DROP FUNCTION posts_comment_counters_delete();
+DROP FUNCTION posts_comment_counters_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0003_alter_comment_options_alter_post_options"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="comment_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Количество комментариев"
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="last_commented_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                null=True,
+                verbose_name="Дата последнего комментария",
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
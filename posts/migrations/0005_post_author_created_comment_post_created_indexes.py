@@ -0,0 +1,31 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("posts", "0004_post_comment_count_post_last_commented_at"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="comment",
+            index=models.Index(
+                fields=["post", "-created", "-id"],
+                name="posts_comment_post_created_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["author", "-created", "-id"],
+                name="posts_post_author_created_idx",
+            ),
+        ),
+    ]
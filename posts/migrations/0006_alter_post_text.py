@@ -0,0 +1,21 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:33
+
+from django.db import migrations, models
+import posts.validators
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0005_post_author_created_comment_post_created_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="text",
+            field=models.TextField(
+                validators=[posts.validators.check_text], verbose_name="Текст поста"
+            ),
+        ),
+    ]
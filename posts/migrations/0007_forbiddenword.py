@@ -0,0 +1,47 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:38
+
+from django.db import migrations, models
+
+# the list formerly hard-coded as settings.FORBIDDEN_WORDS
+INITIAL_WORDS = ["ерунда", "глупость", "чепуха"]
+
+
+def add_initial_words(apps, schema_editor):
+    ForbiddenWord = apps.get_model("posts", "ForbiddenWord")
+    ForbiddenWord.objects.bulk_create(
+        [ForbiddenWord(word=word) for word in INITIAL_WORDS]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0006_alter_post_text"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ForbiddenWord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "word",
+                    models.CharField(max_length=100, unique=True, verbose_name="Слово"),
+                ),
+            ],
+            options={
+                "verbose_name": "Запрещённое слово",
+                "verbose_name_plural": "Запрещённые слова",
+                "ordering": ("word",),
+            },
+        ),
+        migrations.RunPython(add_initial_words, migrations.RunPython.noop),
+    ]
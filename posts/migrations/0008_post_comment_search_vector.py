@@ -0,0 +1,72 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:45
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+CREATE_TRIGGERS = """
+CREATE FUNCTION posts_post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('russian', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('russian', coalesce(NEW.text, '')), 'B');
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION posts_comment_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := to_tsvector('russian', coalesce(NEW.text, ''));
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER posts_post_search_vector_update
+BEFORE INSERT OR UPDATE OF title, text ON posts_post
+FOR EACH ROW EXECUTE FUNCTION posts_post_search_vector_update();
+
+CREATE TRIGGER posts_comment_search_vector_update
+BEFORE INSERT OR UPDATE OF text ON posts_comment
+FOR EACH ROW EXECUTE FUNCTION posts_comment_search_vector_update();
+
+UPDATE posts_post SET search_vector =
+    setweight(to_tsvector('russian', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('russian', coalesce(text, '')), 'B');
+
+-- the counters do not depend on the search vector; the migration is atomic,
+-- so the trigger cannot be left disabled
+ALTER TABLE posts_comment DISABLE TRIGGER posts_comment_counters_update;
+UPDATE posts_comment SET search_vector = to_tsvector('russian', coalesce(text, ''));
+ALTER TABLE posts_comment ENABLE TRIGGER posts_comment_counters_update;
+"""
+
+DROP_TRIGGERS = """
+DROP TRIGGER posts_post_search_vector_update ON posts_post;
+DROP TRIGGER posts_comment_search_vector_update ON posts_comment;
+DROP FUNCTION posts_post_search_vector_update();
+DROP FUNCTION posts_comment_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("posts", "0007_forbiddenword"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="comment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS, DROP_TRIGGERS),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:11
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+import blogger.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("posts", "0011_post_image_renditions"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="post",
+            name="image",
+            field=models.ImageField(
+                blank=True,
+                height_field="image_height",
+                storage=blogger.storage.ContentAddressedStorage(),
+                upload_to="posts/",
+                verbose_name="Картинка",
+                width_field="image_width",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("image", ""), _negated=True),
+                fields=["image"],
+                name="posts_post_image_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:30
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("posts", "0012_post_image_storage"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="comment",
+            index=models.Index(
+                fields=["-created", "-id"], name="posts_comment_created_id_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="post",
+            index=models.Index(
+                fields=["-created", "-id"], name="posts_post_created_id_idx"
+            ),
+        ),
+    ]
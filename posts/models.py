@@ -1,7 +1,11 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 
-from .validators import check_content, check_min_age
+from blogger.storage import ContentAddressedStorage
+from .validators import check_content, check_text
 
 User = settings.AUTH_USER_MODEL
 
@@ -21,10 +25,12 @@ class TextBaseModel(models.Model):
         verbose_name="Дата редактирования",
     )
     text = models.TextField()
+    # maintained by the search vector triggers, see migration 0008
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         abstract = True
-        ordering = ('-created',)
+        ordering = ('-created', '-id')
 
     def __str__(self) -> str:
         return self.text[:15]
@@ -42,6 +48,7 @@ class Post(TextBaseModel):
     )
     text = models.TextField(
         verbose_name='Текст поста',
+        validators=[check_text],
     )
     author = models.ForeignKey(
         User,
@@ -52,12 +59,91 @@ class Post(TextBaseModel):
     image = models.ImageField(
         'Картинка',
         upload_to='posts/',
+        storage=ContentAddressedStorage(),
         blank=True,
+        width_field='image_width',
+        height_field='image_height',
+    )
+    image_width = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Ширина картинки',
+    )
+    image_height = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Высота картинки',
+    )
+    # WebP/AVIF copies of the image, filled in the background by posts.images
+    image_renditions = models.JSONField(
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name='Уменьшенные копии картинки',
+    )
+    # kept in sync by the posts_comment triggers, see migration 0004
+    comment_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Количество комментариев',
+    )
+    last_commented_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name='Дата последнего комментария',
     )
 
     class Meta(TextBaseModel.Meta):
         verbose_name = 'Пост'
         verbose_name_plural = 'Посты'
+        indexes = [
+            # the keyset pagination of the list, see posts.pagination
+            models.Index(fields=('-created', '-id'), name='posts_post_created_id_idx'),
+            models.Index(
+                fields=('author', '-created', '-id'),
+                name='posts_post_author_created_idx',
+            ),
+            GinIndex(fields=('search_vector',), name='posts_post_search_idx'),
+            # back the admin search, see blogger.admin.TrigramSearchMixin
+            GinIndex(
+                OpClass(Upper('title'), name='gin_trgm_ops'),
+                name='posts_post_title_trgm_idx',
+            ),
+            GinIndex(
+                OpClass(Upper('text'), name='gin_trgm_ops'),
+                name='posts_post_text_trgm_idx',
+            ),
+            # the references to the shared image files, see posts.images
+            models.Index(
+                fields=('image',),
+                name='posts_post_image_idx',
+                condition=~models.Q(image=''),
+            ),
+        ]
+
+    # written by the database or in the background, never from an instance
+    # that may be stale, see save()
+    db_maintained_fields = ('comment_count', 'last_commented_at', 'image_renditions')
+
+    def save(self, *args, force_insert=False, update_fields=None, **kwargs):
+        """
+        Save the post without the ``db_maintained_fields``, which would
+        overwrite the changes made since the instance was loaded. They are
+        only written when listed in ``update_fields``.
+
+        """
+        if update_fields is None and not force_insert and not self._state.adding:
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.attname not in self.db_maintained_fields
+            ]
+        super().save(*args, force_insert=force_insert, update_fields=update_fields, **kwargs)
 
 
 class Comment(TextBaseModel):
@@ -81,3 +167,70 @@ class Comment(TextBaseModel):
     class Meta(TextBaseModel.Meta):
         verbose_name = 'Комментарий'
         verbose_name_plural = 'Комментарии'
+        indexes = [
+            models.Index(fields=('-created', '-id'), name='posts_comment_created_id_idx'),
+            models.Index(
+                fields=('post', '-created', '-id'),
+                name='posts_comment_post_created_idx',
+            ),
+            GinIndex(fields=('search_vector',), name='posts_comment_search_idx'),
+            GinIndex(
+                OpClass(Upper('text'), name='gin_trgm_ops'),
+                name='posts_comment_text_trgm_idx',
+            ),
+        ]
+
+
+class TimelineEntry(models.Model):
+    """
+    The posts of the followed authors precomputed for each follower, filled
+    on write when ``FEED_FANOUT_ON_WRITE`` is enabled, see posts.feed.
+
+    """
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Подписчик',
+    )
+    post = models.ForeignKey(
+        Post,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Пост',
+    )
+    # a copy of post.created, so that a page is read from the index alone
+    created = models.DateTimeField(verbose_name='Дата публикации')
+
+    class Meta:
+        verbose_name = 'Запись ленты'
+        verbose_name_plural = 'Записи ленты'
+        constraints = [
+            models.UniqueConstraint(
+                fields=('user', 'post'),
+                name='posts_timelineentry_user_post_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=('user', '-created', '-post'),
+                name='posts_timeline_user_idx',
+            ),
+        ]
+
+
+class ForbiddenWord(models.Model):
+    """Words that posts must not contain, see posts.validators.check_content."""
+    word = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name='Слово',
+    )
+
+    class Meta:
+        ordering = ('word',)
+        verbose_name = 'Запрещённое слово'
+        verbose_name_plural = 'Запрещённые слова'
+
+    def __str__(self) -> str:
+        return self.word
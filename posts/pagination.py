@@ -0,0 +1,193 @@
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import BooleanField, Expression, F, Q, Value
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+class RowComparison(Expression):
+    """The SQL row comparison ``(a, b, ...) < (x, y, ...)``."""
+    conditional = True
+    output_field = BooleanField()
+
+    def __init__(self, lhs, operator, rhs):
+        super().__init__()
+        self.lhs, self.operator, self.rhs = list(lhs), operator, list(rhs)
+
+    def get_source_expressions(self):
+        return [*self.lhs, *self.rhs]
+
+    def set_source_expressions(self, exprs):
+        self.lhs, self.rhs = exprs[:len(self.lhs)], exprs[len(self.lhs):]
+
+    def as_sql(self, compiler, connection):
+        sides, params = [], []
+        for expressions in (self.lhs, self.rhs):
+            sqls = []
+            for expression in expressions:
+                sql, expression_params = compiler.compile(expression)
+                sqls.append(sql)
+                params.extend(expression_params)
+            sides.append(f'({", ".join(sqls)})')
+        return f'{sides[0]} {self.operator} {sides[1]}', params
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset (seek) pagination over a composite ordering.
+
+    Unlike the stock CursorPagination, which seeks on the first ordering
+    field only and skips ties with an OFFSET, the cursor stores the values
+    of every ordering field of the boundary row, so each page is a single
+    ``WHERE (created, id) < (...) ORDER BY ... LIMIT n`` query served by
+    the index, whatever the page number.
+
+    """
+    ordering = ('-created', '-id')
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_request_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page(list(page_queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """The paginate_queryset() of async views, see posts.async_views."""
+        page_queryset = self.get_request_page_queryset(queryset, request, view)
+        if page_queryset is None:
+            return None
+        return self.set_page([row async for row in page_queryset])
+
+    def get_request_page_queryset(self, queryset, request, view=None):
+        """Return the unevaluated query of the requested page and one more row."""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            reverse, position = False, None
+        else:
+            _, reverse, position = self.cursor
+        return self.get_page_queryset(queryset, position, reverse)[:self.page_size + 1]
+
+    def set_page(self, results):
+        if self.cursor is None:
+            reverse, position = False, None
+        else:
+            _, reverse, position = self.cursor
+
+        self.page = results[:self.page_size]
+        has_following = len(results) > self.page_size
+        if reverse:
+            self.page.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        if (self.has_next or self.has_previous) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def get_page_queryset(self, queryset, position, reverse):
+        """Return the ordered queryset of rows following the position."""
+        ordering = self.ordering
+        if reverse:
+            ordering = [self._invert(field) for field in ordering]
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(queryset, ordering, position)
+            )
+        return queryset.order_by(*ordering)
+
+    def get_keyset_filter(self, queryset, ordering, position):
+        """
+        Build ``(f1, f2, ...) > (v1, v2, ...)``, a row comparison the index
+        can seek to when all the fields are ordered in the same direction,
+        otherwise ``f1 > v1 OR (f1 = v1 AND f2 > v2) OR ...``.
+
+        """
+        values = self._parse_position(queryset, position)
+        descending = {field.startswith('-') for field in ordering}
+        if len(descending) == 1:
+            names = [field.lstrip('-') for field in ordering]
+            return RowComparison(
+                [F(name) for name in names],
+                '<' if descending.pop() else '>',
+                [
+                    Value(value, output_field=self._get_output_field(queryset, name))
+                    for name, value in zip(names, values)
+                ],
+            )
+
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[-1], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if self.page:
+            position = self._get_position_from_instance(self.page[0], self.ordering)
+        else:
+            position = self.cursor.position
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = [getattr(instance, field.lstrip('-')) for field in ordering]
+        # isoformat() keeps the microseconds DjangoJSONEncoder would truncate.
+        return json.dumps([
+            value.isoformat() if hasattr(value, 'isoformat') else value
+            for value in values
+        ])
+
+    def _parse_position(self, queryset, position):
+        try:
+            values = json.loads(position)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self._get_output_field(queryset, field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def _get_output_field(queryset, name):
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    @staticmethod
+    def _invert(field):
+        return field[1:] if field.startswith('-') else f'-{field}'
+
+
+class SearchRankPagination(KeysetCursorPagination):
+    """Keyset pagination of search results annotated with their ``rank``."""
+    ordering = ('-rank', '-id')
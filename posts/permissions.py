@@ -1,20 +1,28 @@
+from django.conf import settings
 from rest_framework import permissions
 
-from .validators import check_min_age
-
 
 class IsUserAboveMinAge(permissions.BasePermission):
-    message = "У Вас нет прав добавлять посты."
+
+    @property
+    def message(self):
+        return f"Добавлять посты могут пользователи старше {settings.USER_MIN_AGE}"
 
     def has_permission(self, request, view):
-        check_min_age(request.user.birthday)
-        return True
+        # see users.models.User.adult_since
+        return request.user.is_adult
 
 
 class IsAdminOrAuthor(permissions.BasePermission):
     message = "Вы не можете редактировать посты других пользователей."
 
     def has_object_permission(self, request, view, obj):
-        if request.user.is_staff or obj.author == request.user:
+        if request.user.is_staff or obj.author_id == request.user.id:
             return True
         return False
+
+    def has_bulk_permission(self, request, view, queryset) -> bool:
+        """Check every object of the queryset with a single query."""
+        if request.user.is_staff:
+            return True
+        return not queryset.exclude(author_id=request.user.id).exists()
@@ -0,0 +1,40 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+
+from .pagination import SearchRankPagination
+
+SEARCH_CONFIG = 'russian'
+
+
+class FullTextSearchMixin:
+    """
+    Add a ``GET <prefix>/search/?q=...`` action over the ``search_vector``
+    column, maintained by database triggers and indexed with GIN.
+
+    The query uses the web search syntax (quoted phrases, ``or``, ``-word``),
+    the results are ordered by relevance and paginated by a (rank, id) cursor.
+
+    """
+
+    @action(detail=False, methods=['get'])
+    def search(self, request, *args, **kwargs):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            raise ValidationError({'q': 'Введите поисковый запрос.'})
+
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+        queryset = (
+            self.get_queryset()
+            .filter(search_vector=query)
+            # ts_rank() returns a real, whose text form does not round-trip
+            # exactly through the cursor; compare as double precision instead
+            .annotate(rank=Cast(SearchRank(F('search_vector'), query), FloatField()))
+        )
+
+        paginator = SearchRankPagination()
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        serializer = self.get_serializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
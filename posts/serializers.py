@@ -1,14 +1,86 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models
 from rest_framework import serializers
 
+from blogger.uploads import HeaderValidatedImageField
+
 from .models import Post, Comment
 
 
+class BulkCreateListSerializer(serializers.ListSerializer):
+    """Insert all the validated objects with a single bulk INSERT."""
+
+    def create(self, validated_data):
+        model = self.child.Meta.model
+        return model.objects.bulk_create(
+            [model(**attrs) for attrs in validated_data]
+        )
+
+
+class CommentBulkCreateListSerializer(BulkCreateListSerializer):
+    """
+    Load the posts of all the comments with a single query before validating
+    them, instead of one query per comment, see PostPrimaryKeyRelatedField.
+
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            ids = set()
+            for item in data:
+                if isinstance(item, dict):
+                    try:
+                        ids.add(Post._meta.pk.to_python(item.get('post')))
+                    except ValidationError:
+                        pass
+            ids.discard(None)
+            self.posts = Post.objects.in_bulk(ids)
+        return super().to_internal_value(data)
+
+
+class PostPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    The post of a comment, taken from the posts loaded by
+    CommentBulkCreateListSerializer when the comments are created in bulk.
+
+    """
+
+    def to_internal_value(self, data):
+        posts = getattr(self.root, 'posts', None)
+        if posts is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return posts[Post._meta.pk.to_python(data)]
+        except ValidationError:
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+
+
+class RenditionsField(serializers.ReadOnlyField):
+    """The renditions listed in Post.image_renditions, with their URLs."""
+
+    def to_representation(self, value):
+        storage = Post._meta.get_field('image').storage
+        request = self.context.get('request')
+        renditions = []
+        for rendition in value:
+            url = storage.url(rendition['name'])
+            renditions.append({
+                'url': request.build_absolute_uri(url) if request is not None else url,
+                'format': rendition['format'],
+                'width': rendition['width'],
+                'height': rendition['height'],
+            })
+        return renditions
+
+
 class PostDetailSerializer(serializers.ModelSerializer):
-    comments = serializers.SlugRelatedField(
-        slug_field='pk',
-        many=True,
-        queryset=Comment.objects.all(),
-    )
+    comments = serializers.PrimaryKeyRelatedField(many=True, read_only=True)
+    image_renditions = RenditionsField()
 
     class Meta:
         model = Post
@@ -20,33 +92,55 @@ class PostDetailSerializer(serializers.ModelSerializer):
             'updated',
             'author',
             'image',
+            'image_width',
+            'image_height',
+            'image_renditions',
+            'comment_count',
+            'last_commented_at',
             'comments',
         ]
 
 
+class AsyncPostDetailSerializer(PostDetailSerializer):
+    """PostDetailSerializer reading the comment ids annotated by posts.async_views."""
+    comments = serializers.ListField(
+        child=serializers.IntegerField(),
+        source='comment_ids',
+        read_only=True,
+    )
+
+
 class PostCreateUpdateSerializer(serializers.ModelSerializer):
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.ImageField: HeaderValidatedImageField,
+    }
     author = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    image_renditions = RenditionsField()
 
     class Meta:
         model = Post
+        list_serializer_class = BulkCreateListSerializer
         read_only_fields = ["id", "created", "updated", "author"]
-        fields = "__all__"
+        exclude = ["search_vector"]
 
 
 class CommentDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Comment
-        fields = '__all__'
+        exclude = ['search_vector']
 
 
 class CommentCreateSerializer(serializers.ModelSerializer):
     author = serializers.HiddenField(default=serializers.CurrentUserDefault())
+    post = PostPrimaryKeyRelatedField(queryset=Post.objects.all())
 
     class Meta:
         model = Comment
+        list_serializer_class = CommentBulkCreateListSerializer
         read_only_fields = ["id", "created", "updated", "author"]
-        fields = "__all__"
+        exclude = ["search_vector"]
 
 
 class CommentUpdateSerializer(serializers.ModelSerializer):
@@ -55,4 +149,12 @@ class CommentUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Comment
         read_only_fields = ["id", "created", "updated", "author", "post"]
-        fields = "__all__"
+        exclude = ["search_vector"]
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=settings.BULK_DELETE_MAX_SIZE,
+    )
@@ -0,0 +1,53 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from users.models import Follow
+from .cache import bump_versions, invalidate_post, invalidate_comment
+from .feed import add_to_timelines, follow_timeline, unfollow_timeline
+from .images import schedule_image_gc
+from .models import Post, Comment, ForbiddenWord
+from .validators import FORBIDDEN_WORDS_NAMESPACE
+
+
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_responses(sender, instance, **kwargs):
+    # bump after commit, so that no reader caches the data being replaced
+    # under the new version; the pk of a deleted instance is set to None
+    pk = instance.pk
+    transaction.on_commit(lambda: invalidate_post(pk))
+
+
+@receiver(post_delete, sender=Post)
+def collect_post_image(sender, instance, **kwargs):
+    # also sent for the posts deleted by CASCADE with their author
+    schedule_image_gc(instance.image.name, instance.image_renditions)
+
+
+@receiver(post_save, sender=Post)
+def fan_out_post(sender, instance, created, **kwargs):
+    if created:
+        add_to_timelines([instance.pk])
+
+
+@receiver(post_save, sender=Follow)
+def fan_out_followed_posts(sender, instance, created, **kwargs):
+    if created:
+        follow_timeline(instance.follower_id, instance.author_id)
+
+
+@receiver(post_delete, sender=Follow)
+def remove_unfollowed_posts(sender, instance, **kwargs):
+    unfollow_timeline(instance.follower_id, instance.author_id)
+
+
+@receiver([post_save, post_delete], sender=Comment)
+def invalidate_comment_responses(sender, instance, **kwargs):
+    pk, post_pk = instance.pk, instance.post_id
+    transaction.on_commit(lambda: invalidate_comment(pk, post_pk))
+
+
+@receiver([post_save, post_delete], sender=ForbiddenWord)
+def reload_forbidden_words(sender, **kwargs):
+    # bump after commit, so that workers reloading the words see the change
+    transaction.on_commit(lambda: bump_versions(FORBIDDEN_WORDS_NAMESPACE))
@@ -1,7 +1,8 @@
 from django.urls import path, include
 from rest_framework.routers import SimpleRouter
 
-from .views import PostViewSet, CommentViewSet
+from . import async_views
+from .views import PostViewSet, CommentViewSet, FeedViewSet
 
 app_name = 'posts'
 
@@ -11,7 +12,15 @@ post_router.register(r'posts', PostViewSet, basename="posts")
 comment_router = SimpleRouter()
 comment_router.register(r'comments', CommentViewSet, basename="comments")
 
+feed_router = SimpleRouter()
+feed_router.register(r'feed', FeedViewSet, basename="feed")
+
 urlpatterns = [
     path("", include(post_router.urls)),
     path("", include(comment_router.urls)),
+    path("", include(feed_router.urls)),
+    path("async/posts/", async_views.post_list, name="async-posts-list"),
+    path("async/posts/<int:pk>/", async_views.post_detail, name="async-posts-detail"),
+    path("async/comments/", async_views.comment_list, name="async-comments-list"),
+    path("async/comments/<int:pk>/", async_views.comment_detail, name="async-comments-detail"),
 ]
\ No newline at end of file
@@ -1,34 +1,133 @@
 import re
-from calendar import leapdays
-from datetime import date
+import time
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from rest_framework.exceptions import PermissionDenied
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
+from .cache import get_versions
 
-def check_content(content: str, forbidden_words: list = settings.FORBIDDEN_WORDS):
+
+class ForbiddenWordsMatcher:
+    """
+    Find forbidden words in a text with a single precompiled regex.
+
+    The words are merged into a trie, which is rendered as one regex whose
+    alternations share their common prefixes, so a search does not depend
+    on the number of words the way a plain ``a|b|c`` alternation does.
+    Matching is case-insensitive through Unicode case folding.
+
+    """
+    def __init__(self, words):
+        self.words = sorted({word.casefold() for word in words if word})
+        self.pattern = re.compile(self._build_pattern(self.words)) if self.words else None
+
+    def find(self, content: str) -> list:
+        """Return the forbidden words found in the content, in order of appearance."""
+        if self.pattern is None:
+            return []
+        return list(dict.fromkeys(self.pattern.findall(content.casefold())))
+
+    @classmethod
+    def _build_pattern(cls, words) -> str:
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        return cls._node_pattern(trie)
+
+    @classmethod
+    def _node_pattern(cls, node) -> str:
+        is_word_end = '' in node
+        branches = [
+            re.escape(char) + cls._node_pattern(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ''
+        if len(branches) == 1:
+            pattern = branches[0]
+            is_atom = len(pattern) == 1
+        elif all(len(branch) == 1 for branch in branches):
+            pattern = f'[{"".join(branches)}]'
+            is_atom = True
+        else:
+            pattern = f'(?:{"|".join(branches)})'
+            is_atom = True
+        if not is_word_end:
+            return pattern
+        return f'{pattern}?' if is_atom else f'(?:{pattern})?'
+
+
+FORBIDDEN_WORDS_NAMESPACE = 'forbidden-words'
+
+_matcher = None
+_matcher_version = None
+_matcher_checked_at = 0.0
+
+
+def get_forbidden_words_matcher() -> ForbiddenWordsMatcher:
     """
-    Validate that the content does not contain forbidden words.
+    Return the process-local matcher of the :model:`posts.ForbiddenWord` words.
+
+    The matcher is rebuilt when the shared version counter, bumped on every
+    change of the words, differs from the one it was built for. The counter
+    is looked up in the cache at most once per
+    settings.FORBIDDEN_WORDS_CHECK_INTERVAL seconds, so validation does not
+    query the database.
 
     """
-    pattern = fr'{"|".join(forbidden_words)}'
-    if re.search(pattern, content, flags=re.I):
+    global _matcher, _matcher_version, _matcher_checked_at
+    now = time.monotonic()
+    if _matcher is not None and now - _matcher_checked_at < settings.FORBIDDEN_WORDS_CHECK_INTERVAL:
+        return _matcher
+
+    from .models import ForbiddenWord
+
+    [version] = get_versions(FORBIDDEN_WORDS_NAMESPACE)
+    if _matcher is None or version != _matcher_version:
+        _matcher = ForbiddenWordsMatcher(
+            ForbiddenWord.objects.values_list('word', flat=True)
+        )
+        _matcher_version = version
+    _matcher_checked_at = now
+    return _matcher
+
+
+def reset_forbidden_words_matcher():
+    global _matcher
+    _matcher = None
+
+
+@receiver(setting_changed)
+def reset_matcher_on_setting_change(setting, **kwargs):
+    if setting == 'FORBIDDEN_WORDS_CHECK_INTERVAL':
+        reset_forbidden_words_matcher()
+
+
+def check_content(content: str):
+    """
+    Validate that the title does not contain forbidden words.
+
+    """
+    found = get_forbidden_words_matcher().find(content)
+    if found:
         raise ValidationError(
-            f"Заголовок не должен содержать следующие слова: {', '.join(forbidden_words)}"
+            f"Заголовок не должен содержать следующие слова: {', '.join(found)}"
         )
 
 
-def check_min_age(birthday: date, min_age: int = settings.USER_MIN_AGE):
+def check_text(content: str):
     """
-    Validate that the User's age is older than settings.USER_MIN_AGE.
+    Validate that the text does not contain forbidden words.
 
     """
-    today = date.today()
-    min_days_diff = 365 * min_age + leapdays(birthday.year, today.year)
-    actual_days_diff = (today - birthday).days
-    if actual_days_diff < min_days_diff:
-        raise PermissionDenied(
-            f"Добавлять посты могут пользователи старше {min_age}"
+    found = get_forbidden_words_matcher().find(content)
+    if found:
+        raise ValidationError(
+            f"Текст не должен содержать следующие слова: {', '.join(found)}"
         )
 
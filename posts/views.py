@@ -1,22 +1,40 @@
-from rest_framework import viewsets
+from django.db import connection, transaction
+from django.db.models import Prefetch
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.response import Response
 
+from blogger.mixins import (BulkCreateMixin, ConditionalGetMixin, SerializerColumnsMixin,
+                            StreamingListMixin)
+from .cache import CachedReadMixin, bump_versions
+from .feed import FeedPagination, add_to_timelines
+from .images import schedule_image_gc, schedule_renditions
 from .models import Post, Comment
+from .pagination import KeysetCursorPagination
 from .permissions import IsUserAboveMinAge, IsAdminOrAuthor
+from .search import FullTextSearchMixin
 from .serializers import (PostDetailSerializer, CommentDetailSerializer, PostCreateUpdateSerializer,
-                          CommentUpdateSerializer, CommentCreateSerializer)
+                          CommentUpdateSerializer, CommentCreateSerializer, BulkDeleteSerializer)
 
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(StreamingListMixin, CachedReadMixin, ConditionalGetMixin, BulkCreateMixin,
+                  FullTextSearchMixin, SerializerColumnsMixin, viewsets.ModelViewSet):
     """A viewset for viewing and editing Post instances."""
     serializer_class = PostDetailSerializer
-    queryset = Post.objects.all()
+    queryset = Post.objects.defer('search_vector')
+    pagination_class = KeysetCursorPagination
+    cache_namespace = 'post'
+    serializer_columns_actions = ('list', 'retrieve', 'search')
+    # the comments and image renditions of a post are part of its representation,
+    # but are written without changing its updated
+    etag_fields = ('comment_count', 'last_commented_at', 'image_renditions')
 
     def get_permissions(self):
         """Instantiates and returns the list of permissions that this view requires."""
-        if self.action in ('retrieve', 'list'):
+        if self.action in ('retrieve', 'list', 'search'):
             permission_classes = [AllowAny]
-        elif self.action == 'create':
+        elif self.action in ('create', 'bulk_create'):
             permission_classes = [IsAuthenticated, IsUserAboveMinAge]
         elif self.action in ('update', 'partial_update', 'destroy'):
             permission_classes = [IsAuthenticated, IsAdminOrAuthor]
@@ -26,33 +44,74 @@ class PostViewSet(viewsets.ModelViewSet):
 
     def get_serializer_class(self):
         """Returns the serializer class for each particular method"""
-        if self.action in ('retrieve', 'list'):
+        if self.action in ('retrieve', 'list', 'search'):
             return PostDetailSerializer
-        elif self.action in ("create", "partial_update", "update"):
+        elif self.action in ("create", "bulk_create", "partial_update", "update"):
             return PostCreateUpdateSerializer
         else:
             return PostDetailSerializer
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         if self.action == 'list':
             user = self.request.query_params.get('user')
             if user:
-                return Post.objects.filter(author=user).all()
-        return self.queryset
+                queryset = queryset.filter(author=user)
+        if self.action == 'destroy':
+            # the columns checked by IsAdminOrAuthor and read by posts.signals
+            queryset = queryset.only(
+                'id', 'author_id', 'image', 'image_width', 'image_height', 'image_renditions'
+            )
+        if self.action in ('retrieve', 'list', 'search'):
+            # load the comment ids of the whole page in a single query
+            queryset = queryset.prefetch_related(Prefetch(
+                'comments',
+                queryset=Comment.objects.only('id', 'post_id'),
+            ))
+        return queryset
+
+    def perform_create(self, serializer):
+        post = serializer.save()
+        schedule_renditions(post)
+
+    def perform_update(self, serializer):
+        if 'image' not in serializer.validated_data:
+            serializer.save()
+            return
+        old_image = serializer.instance.image.name
+        old_renditions = serializer.instance.image_renditions
+        with transaction.atomic():
+            post = serializer.save()
+            if post.image.name != old_image:
+                # Post.save() never writes the renditions, see db_maintained_fields
+                Post.objects.filter(pk=post.pk).update(image_renditions=[])
+                post.image_renditions = []
+                schedule_image_gc(old_image, old_renditions)
+                schedule_renditions(post)
 
+    def perform_bulk_create(self, serializer):
+        posts = serializer.save()
+        # bulk_create does not send post_save; bump once the posts commit
+        transaction.on_commit(lambda: bump_versions('post-list'))
+        add_to_timelines([post.pk for post in posts])
 
-class CommentViewSet(viewsets.ModelViewSet):
+
+class CommentViewSet(StreamingListMixin, CachedReadMixin, ConditionalGetMixin, BulkCreateMixin,
+                     FullTextSearchMixin, SerializerColumnsMixin, viewsets.ModelViewSet):
     """A viewset for viewing and editing Post instances."""
     serializer_class = CommentDetailSerializer
-    queryset = Comment.objects.all()
+    queryset = Comment.objects.defer('search_vector')
+    pagination_class = KeysetCursorPagination
+    cache_namespace = 'comment'
+    serializer_columns_actions = ('list', 'retrieve', 'search')
 
     def get_permissions(self):
         """Instantiates and returns the list of permissions that this view requires."""
-        if self.action in ('retrieve', 'list'):
+        if self.action in ('retrieve', 'list', 'search'):
             permission_classes = [AllowAny]
-        elif self.action == 'create':
+        elif self.action in ('create', 'bulk_create'):
             permission_classes = [IsAuthenticated]
-        elif self.action in ('update', 'partial_update', 'destroy'):
+        elif self.action in ('update', 'partial_update', 'destroy', 'bulk_delete'):
             permission_classes = [IsAuthenticated, IsAdminOrAuthor]
         else:
             permission_classes = [IsAuthenticated]
@@ -64,14 +123,78 @@ class CommentViewSet(viewsets.ModelViewSet):
             return CommentDetailSerializer
         elif self.action in ("partial_update", "update"):
             return CommentUpdateSerializer
-        elif self.action == "create":
+        elif self.action in ("create", "bulk_create"):
             return CommentCreateSerializer
+        elif self.action == "bulk_delete":
+            return BulkDeleteSerializer
         else:
             return CommentDetailSerializer
 
     def get_queryset(self):
+        queryset = super().get_queryset()
         if self.action == 'list':
             post = self.request.query_params.get('post')
             if post:
-                return Comment.objects.filter(post=post).all()
-        return self.queryset
+                queryset = queryset.filter(post=post)
+        if self.action == 'destroy':
+            # the columns checked by IsAdminOrAuthor and read by posts.signals
+            queryset = queryset.only('id', 'author_id', 'post_id')
+        return queryset
+
+    def check_bulk_permissions(self, request, queryset):
+        """Check the object permissions of a whole queryset at once."""
+        for permission in self.get_permissions():
+            has_bulk_permission = getattr(permission, 'has_bulk_permission', None)
+            if has_bulk_permission and not has_bulk_permission(request, self, queryset):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None),
+                )
+
+    def perform_bulk_create(self, serializer):
+        comments = serializer.save()
+        # bulk_create does not send post_save; bump once the comments commit
+        keys = ['comment-list', 'post-list', *{f'post-{comment.post_id}' for comment in comments}]
+        transaction.on_commit(lambda: bump_versions(*keys))
+
+    @action(detail=False, methods=['post'], url_path='bulk-delete')
+    def bulk_delete(self, request, *args, **kwargs):
+        """Delete the comments with the given ids in a single DELETE."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data['ids']
+
+        with transaction.atomic():
+            self.check_bulk_permissions(request, Comment.objects.filter(pk__in=ids))
+            # the posts_comment triggers update the counters once per post
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f'DELETE FROM {Comment._meta.db_table} WHERE id = ANY(%s) '
+                    f'RETURNING id, post_id',
+                    [ids],
+                )
+                deleted = cursor.fetchall()
+
+        # a single set_many() however many comments were deleted
+        bump_versions(
+            'comment-list',
+            'post-list',
+            *{f'comment-{pk}' for pk, _ in deleted},
+            *{f'post-{post_id}' for _, post_id in deleted},
+        )
+        return Response({'deleted': sorted(pk for pk, _ in deleted)})
+
+
+class FeedViewSet(SerializerColumnsMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
+    """The posts of the authors the request user follows, newest first."""
+    serializer_class = PostDetailSerializer
+    queryset = Post.objects.all()
+    pagination_class = FeedPagination
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related(Prefetch(
+            'comments',
+            queryset=Comment.objects.only('id', 'post_id'),
+        ))
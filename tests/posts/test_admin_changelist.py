@@ -0,0 +1,59 @@
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestAdminChangelist(TestCase):
+    """Test suite for the number of queries run by the admin changelists."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.admin = UserFactory(is_staff=True, is_superuser=True)
+
+    def setUp(self):
+        self.client.force_login(TestAdminChangelist.admin)
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return len(queries)
+
+    def assertConstantQueries(self, url, create_rows):
+        create_rows(2)
+        expected = self.count_queries(url)
+        create_rows(20)
+        self.assertEqual(self.count_queries(url), expected)
+
+    def test_post_changelist_queries(self):
+        """The posts changelist loads the authors with the page."""
+        self.assertConstantQueries(
+            '/admin/posts/post/', lambda size: PostFactory.create_batch(size=size)
+        )
+
+    def test_comment_changelist_queries(self):
+        """The comments changelist loads the authors with the page."""
+        self.assertConstantQueries(
+            '/admin/posts/comment/',
+            lambda size: CommentFactory.create_batch(size=size),
+        )
+
+    def test_user_changelist_queries(self):
+        """The users changelist does not depend on the number of users."""
+        self.assertConstantQueries(
+            '/admin/users/user/', lambda size: UserFactory.create_batch(size=size)
+        )
+
+    def test_post_changelist_skips_full_count(self):
+        """A filtered changelist does not count the whole table."""
+        PostFactory.create_batch(size=3)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/admin/posts/post/', data={'q': 'Title'})
+        counts = [q['sql'] for q in queries if 'COUNT(*)' in q['sql']]
+        self.assertEqual(len(counts), 1)
+        self.assertIn('WHERE', counts[0])
@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import override_settings
+from django.test.client import RequestFactory
+
+from blogger.admin import EstimatedCountPaginator
+from posts.models import Post, Comment
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestAdminSearch(TestCase):
+    """Test suite for the trigram-indexed search of the admin changelists."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.admin = UserFactory(is_staff=True, is_superuser=True)
+        cls.author = UserFactory(username='kotofei')
+        cls.title_match = PostFactory(title='Cats and dogs', text='pets')
+        cls.text_match = PostFactory(title='notes', text='my CATS sleep')
+        cls.author_match = PostFactory(title='weather', author=cls.author)
+        cls.comment = CommentFactory(post=cls.author_match, text='cats again')
+        CommentFactory(post=cls.author_match, text='sunny')
+
+    def setUp(self):
+        self.client.force_login(TestAdminSearch.admin)
+
+    def search(self, model, search_term):
+        model_admin = site._registry[model]
+        request = RequestFactory().get('/')
+        queryset, may_have_duplicates = model_admin.get_search_results(
+            request, model.objects.all(), search_term
+        )
+        self.assertFalse(may_have_duplicates)
+        return queryset
+
+    def test_search_posts(self):
+        """Words match the title, text and author username case-insensitively."""
+        self.assertSetEqual(
+            set(self.search(Post, 'cat')),
+            {TestAdminSearch.title_match, TestAdminSearch.text_match},
+        )
+        self.assertSetEqual(
+            set(self.search(Post, 'KOTO')), {TestAdminSearch.author_match}
+        )
+        self.assertSetEqual(
+            set(self.search(Post, 'cats sleep')), {TestAdminSearch.text_match}
+        )
+
+    def test_search_comments(self):
+        """Comments are searched by text, the model has no title."""
+        self.assertSetEqual(
+            set(self.search(Comment, 'cats')), {TestAdminSearch.comment}
+        )
+
+    def test_changelist_search(self):
+        """The changelists answer searches."""
+        for url in ('/admin/posts/post/', '/admin/posts/comment/', '/admin/users/user/'):
+            with self.subTest(url=url):
+                response = self.client.get(url, data={'q': 'cat'})
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+        response = self.client.get('/admin/posts/post/', data={'q': 'cat'})
+        self.assertEqual(response.context['cl'].result_count, 2)
+
+    def test_search_uses_trigram_indexes(self):
+        """The search conditions are served by the trigram indexes."""
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        plan = self.search(Post, 'cat').order_by().explain()
+        for index_name in (
+            'posts_post_title_trgm_idx',
+            'posts_post_text_trgm_idx',
+            'users_user_username_trgm_idx',
+        ):
+            self.assertIn(index_name, plan)
+        self.assertIn(
+            'posts_comment_text_trgm_idx',
+            self.search(Comment, 'cat').order_by().explain(),
+        )
+
+
+class TestEstimatedCountPaginator(TestCase):
+    """Test suite for the changelist paginator estimating the count."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        PostFactory.create_batch(size=3)
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE posts_post')
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=1)
+    def test_unfiltered_count_is_estimated(self):
+        """The count of a large unfiltered table comes from pg_class."""
+        paginator = EstimatedCountPaginator(Post.objects.all(), 2)
+        with self.assertNumQueries(1) as queries:
+            self.assertEqual(paginator.count, 3)
+        self.assertIn('reltuples', queries.captured_queries[0]['sql'])
+
+    @override_settings(ESTIMATED_COUNT_THRESHOLD=1)
+    def test_filtered_count_is_exact(self):
+        """A filtered queryset is counted."""
+        paginator = EstimatedCountPaginator(Post.objects.filter(pk=0), 2)
+        self.assertEqual(paginator.count, 0)
+
+    def test_small_table_count_is_exact(self):
+        """Tables below ESTIMATED_COUNT_THRESHOLD are counted."""
+        paginator = EstimatedCountPaginator(Post.objects.all(), 2)
+        with self.assertNumQueries(2):
+            self.assertEqual(paginator.count, 3)
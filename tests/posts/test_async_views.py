@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from tests.factories import PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestAsyncViews(TestCase):
+    """Test suite for the async read views of posts and comments."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.posts = PostFactory.create_batch(size=5)
+        for post in cls.posts[:2]:
+            CommentFactory.create_batch(size=3, post=post)
+
+    def setUp(self):
+        cache.clear()
+        self.guest_client = APIClient()
+
+    def assertSameResponse(self, sync_url, async_url):
+        sync_response = self.guest_client.get(path=sync_url)
+        async_response = self.guest_client.get(path=async_url)
+        self.assertEqual(async_response.status_code, sync_response.status_code)
+        # the pagination links only differ by the path prefix
+        self.assertEqual(
+            async_response.content.decode().replace('/async/', '/'),
+            sync_response.content.decode(),
+        )
+
+    def test_lists_match_sync_views(self):
+        """The async lists return the same pages as the viewsets."""
+        post = TestAsyncViews.posts[0]
+        for query in ("", "?page_size=2", f"?user={post.author_id}"):
+            with self.subTest(query=query):
+                self.assertSameResponse(f"/posts/{query}", f"/async/posts/{query}")
+        for query in ("", "?page_size=2", f"?post={post.pk}"):
+            with self.subTest(query=query):
+                self.assertSameResponse(f"/comments/{query}", f"/async/comments/{query}")
+
+    def test_pagination(self):
+        """The async lists page through every row with the keyset cursor."""
+        ids, url = [], "/async/posts/?page_size=2"
+        while url:
+            response = self.guest_client.get(path=url)
+            ids += [post['id'] for post in response.json()['results']]
+            url = response.json()['next']
+        self.assertEqual(len(ids), len(TestAsyncViews.posts))
+
+    def test_details_match_sync_views(self):
+        """The async details return the same objects as the viewsets."""
+        post = TestAsyncViews.posts[0]
+        self.assertSameResponse(f"/posts/{post.pk}/", f"/async/posts/{post.pk}/")
+        comment = post.comments.first()
+        self.assertSameResponse(
+            f"/comments/{comment.pk}/", f"/async/comments/{comment.pk}/"
+        )
+
+    def test_not_found(self):
+        """Unknown objects and cursors are answered with 404."""
+        for url in ("/async/posts/0/", "/async/comments/0/", "/async/posts/?cursor=bad"):
+            with self.subTest(url=url):
+                response = self.guest_client.get(path=url)
+                self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+    def test_read_only(self):
+        """The async views only answer GET requests."""
+        response = self.guest_client.post(path="/async/posts/", data={})
+        self.assertEqual(response.status_code, HTTPStatus.METHOD_NOT_ALLOWED)
@@ -0,0 +1,127 @@
+from datetime import datetime
+from http import HTTPStatus
+
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from tests.factories import UserFactory
+from tests.utils import TestCase
+
+URL = "/posts/bulk/"
+
+
+class TestPostBulkCreate(TestCase):
+    """Test suite for creating several posts in one request."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+        cls.under_age_user = UserFactory(birthday=datetime(2020, 1, 1))
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestPostBulkCreate.user)
+
+        self.authorized_under_age_user = APIClient()
+        self.authorized_under_age_user.force_login(
+            TestPostBulkCreate.under_age_user
+        )
+
+    def test_bulk_create_posts_success(self):
+        """All the posts are created by the request user."""
+        data = [
+            {"title": f"Тестовый заголовок {i}", "text": "Тестовый пост"}
+            for i in range(5)
+        ]
+
+        response = self.authorized_client.post(path=URL, data=data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(len(response.data), len(data))
+        self.assertEqual(
+            Post.objects.filter(
+                author=TestPostBulkCreate.user,
+                pk__in=[post['id'] for post in response.data],
+            ).count(),
+            len(data),
+        )
+
+    def test_bulk_create_posts_invalidates_list(self):
+        """The cached posts list is invalidated once the posts commit."""
+        self.guest_client.get(path="/posts/")
+        data = [{"title": "Тестовый заголовок", "text": "Тестовый пост"}]
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.authorized_client.post(path=URL, data=data, format='json')
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(len(self.guest_client.get(path="/posts/").data['results']), 0)
+
+        for callback in callbacks:
+            callback()
+        self.assertEqual(len(self.guest_client.get(path="/posts/").data['results']), 1)
+
+    def test_bulk_create_posts_single_insert(self):
+        """The posts are inserted with a single query."""
+        data = [
+            {"title": f"Тестовый заголовок {i}", "text": "Тестовый пост"}
+            for i in range(20)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.authorized_client.post(path=URL, data=data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        inserts = [
+            query for query in queries
+            if query['sql'].startswith('INSERT INTO "posts_post"')
+        ]
+        self.assertEqual(len(inserts), 1)
+
+    def test_bulk_create_posts_item_errors(self):
+        """Errors are reported per item and no post is created."""
+        post_count = Post.objects.count()
+        data = [
+            {"title": "Тестовый заголовок", "text": "Тестовый пост"},
+            {"title": "Полная ерунда", "text": "Тестовый пост"},
+            {"text": "Тестовый пост"},
+        ]
+
+        response = self.authorized_client.post(path=URL, data=data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('title', response.data[1])
+        self.assertIn('title', response.data[2])
+        self.assertEqual(Post.objects.count(), post_count)
+
+    @override_settings(BULK_CREATE_MAX_SIZE=2)
+    def test_bulk_create_posts_too_many(self):
+        """Requests above settings.BULK_CREATE_MAX_SIZE items are rejected."""
+        data = [
+            {"title": f"Тестовый заголовок {i}", "text": "Тестовый пост"}
+            for i in range(3)
+        ]
+
+        response = self.authorized_client.post(path=URL, data=data, format='json')
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertFalse(
+            Post.objects.filter(title__in=[item['title'] for item in data]).exists()
+        )
+
+    def test_bulk_create_posts_forbidden(self):
+        """Guests and under age users cannot create posts in bulk."""
+        data = [{"title": "Тестовый заголовок", "text": "Тестовый пост"}]
+        for client, status in (
+            (self.guest_client, HTTPStatus.UNAUTHORIZED),
+            (self.authorized_under_age_user, HTTPStatus.FORBIDDEN),
+        ):
+            with self.subTest(status=status):
+                response = client.post(path=URL, data=data, format='json')
+                self.assertEqual(response.status_code, status)
+        self.assertFalse(Post.objects.filter(title=data[0]['title']).exists())
@@ -0,0 +1,189 @@
+from http import HTTPStatus
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from posts.models import Post, Comment
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestCommentBulk(TestCase):
+    """Test suite for creating and deleting comments in bulk."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+        cls.admin = UserFactory(is_staff=True)
+        cls.post = PostFactory()
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestCommentBulk.user)
+
+        self.admin_client = APIClient()
+        self.admin_client.force_login(TestCommentBulk.admin)
+
+    def test_bulk_create_comments_success(self):
+        """The comments are created and counted on their post."""
+        post = TestCommentBulk.post
+        data = [{"text": f"Комментарий {i}", "post": post.pk} for i in range(5)]
+
+        response = self.authorized_client.post(
+            path="/comments/bulk/", data=data, format='json'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(
+            Comment.objects.filter(post=post, author=TestCommentBulk.user).count(), 5
+        )
+        self.assertEqual(Post.objects.get(pk=post.pk).comment_count, 5)
+
+    def test_bulk_create_comments_item_errors(self):
+        """Errors are reported per item and no comment is created."""
+        data = [
+            {"text": "Комментарий", "post": TestCommentBulk.post.pk},
+            {"text": "Комментарий"},
+        ]
+
+        response = self.authorized_client.post(
+            path="/comments/bulk/", data=data, format='json'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('post', response.data[1])
+        self.assertFalse(Comment.objects.filter(post=TestCommentBulk.post).exists())
+
+    def test_bulk_create_comments_loads_posts_once(self):
+        """The posts of all the comments are loaded with a single query."""
+        posts = PostFactory.create_batch(size=3)
+        data = [
+            {"text": f"Комментарий {i}", "post": posts[i % 3].pk} for i in range(6)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.authorized_client.post(
+                path="/comments/bulk/", data=data, format='json'
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        post_table = f'FROM "{Post._meta.db_table}"'
+        self.assertEqual(len([q for q in queries if post_table in q['sql']]), 1)
+        for post in posts:
+            self.assertEqual(Post.objects.get(pk=post.pk).comment_count, 2)
+
+    def test_bulk_create_comments_unknown_post(self):
+        """A missing post is reported at the index of its comment."""
+        data = [
+            {"text": "Комментарий", "post": TestCommentBulk.post.pk},
+            {"text": "Комментарий", "post": 0},
+            {"text": "Комментарий", "post": "abc"},
+        ]
+
+        response = self.authorized_client.post(
+            path="/comments/bulk/", data=data, format='json'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(response.data[1]['post'][0].code, 'does_not_exist')
+        self.assertEqual(response.data[2]['post'][0].code, 'incorrect_type')
+        self.assertFalse(Comment.objects.filter(post=TestCommentBulk.post).exists())
+
+    def test_bulk_create_comments_invalidates_post(self):
+        """The cached post is refreshed once the comments are committed."""
+        post = TestCommentBulk.post
+        path = f"/posts/{post.pk}/"
+        self.guest_client.get(path)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.authorized_client.post(
+                path="/comments/bulk/",
+                data=[{"text": "Комментарий", "post": post.pk}],
+                format='json',
+            )
+
+        self.assertEqual(self.guest_client.get(path).data['comment_count'], 1)
+
+    def test_bulk_delete_own_comments(self):
+        """An author deletes their comments with a single DELETE query."""
+        comments = CommentFactory.create_batch(
+            size=4, post=TestCommentBulk.post, author=TestCommentBulk.user
+        )
+        ids = [comment.pk for comment in comments[:3]]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.authorized_client.post(
+                path="/comments/bulk-delete/", data={"ids": ids}, format='json'
+            )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(response.data['deleted'], sorted(ids))
+        self.assertEqual(
+            len([q for q in queries if q['sql'].startswith('DELETE')]), 1
+        )
+        self.assertFalse(Comment.objects.filter(pk__in=ids).exists())
+        self.assertEqual(Post.objects.get(pk=TestCommentBulk.post.pk).comment_count, 1)
+
+    def test_bulk_delete_bumps_versions_at_once(self):
+        """The cached comments are invalidated with a single cache write."""
+        comments = CommentFactory.create_batch(
+            size=20, post=TestCommentBulk.post, author=TestCommentBulk.user
+        )
+        path = f"/comments/{comments[0].pk}/"
+        self.assertEqual(self.guest_client.get(path).status_code, HTTPStatus.OK)
+
+        with mock.patch.object(cache, 'set_many', wraps=cache.set_many) as set_many:
+            self.authorized_client.post(
+                path="/comments/bulk-delete/",
+                data={"ids": [comment.pk for comment in comments]},
+                format='json',
+            )
+
+        self.assertEqual(set_many.call_count, 1)
+        self.assertEqual(self.guest_client.get(path).status_code, HTTPStatus.NOT_FOUND)
+
+    def test_bulk_delete_foreign_comments_forbidden(self):
+        """A user cannot delete the comments of other users, even partially."""
+        own = CommentFactory(post=TestCommentBulk.post, author=TestCommentBulk.user)
+        foreign = CommentFactory(post=TestCommentBulk.post)
+
+        response = self.authorized_client.post(
+            path="/comments/bulk-delete/",
+            data={"ids": [own.pk, foreign.pk]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+        self.assertEqual(Comment.objects.filter(pk__in=[own.pk, foreign.pk]).count(), 2)
+
+    def test_bulk_delete_by_admin(self):
+        """An admin deletes the comments of any user."""
+        comments = CommentFactory.create_batch(size=3, post=TestCommentBulk.post)
+
+        response = self.admin_client.post(
+            path="/comments/bulk-delete/",
+            data={"ids": [comment.pk for comment in comments]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(Comment.objects.filter(post=TestCommentBulk.post).exists())
+
+    def test_bulk_delete_unauthorised(self):
+        """Guests cannot delete comments."""
+        comment = CommentFactory(post=TestCommentBulk.post)
+
+        response = self.guest_client.post(
+            path="/comments/bulk-delete/", data={"ids": [comment.pk]}, format='json'
+        )
+
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+        self.assertTrue(Comment.objects.filter(pk=comment.pk).exists())
@@ -1,10 +1,10 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.test import APIClient
 
 from posts.serializers import CommentDetailSerializer
 from tests.factories import UserFactory, CommentFactory
+from tests.utils import TestCase
 
 
 class TestCommentDetail(TestCase):
@@ -1,11 +1,11 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from django.utils import timezone
 from rest_framework.test import APIClient
 
 from posts.models import Comment
 from tests.factories import PostFactory, UserFactory, CommentFactory
+from tests.utils import TestCase
 
 
 class TestCommentUpdate(TestCase):
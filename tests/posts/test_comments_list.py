@@ -1,11 +1,11 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.test import APIClient
 
 from posts.models import Comment
 from posts.serializers import CommentDetailSerializer
 from tests.factories import UserFactory, CommentFactory, PostFactory
+from tests.utils import TestCase
 
 
 class TestCommentList(TestCase):
@@ -30,13 +30,13 @@ class TestCommentList(TestCase):
         """Test for retrieving a list of comments by an authorised user."""
         response = self.authorized_client.get(path=TestCommentList.url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.assertEqual(len(response.data), Comment.objects.count())
+        self.assertEqual(len(response.data['results']), Comment.objects.count())
 
     def test_comment_list_unauthorised(self):
         """Test for retrieving a list of comments by an unauthorised user."""
         response = self.guest_client.get(path=TestCommentList.url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.assertEqual(len(response.data), Comment.objects.count())
+        self.assertEqual(len(response.data['results']), Comment.objects.count())
 
     def test_comment_list_filter_by_post(self):
         """Test for retrieving a list of comments filtered by a post."""
@@ -48,5 +48,5 @@ class TestCommentList(TestCase):
 
         path = TestCommentList.url + f'?post={post.pk}'
         response = self.guest_client.get(path=path)
-        self.assertListEqual(response.data, expected_result)
+        self.assertListEqual(response.data['results'], expected_result)
 
@@ -0,0 +1,89 @@
+from http import HTTPStatus
+
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestPostConditionalGet(TestCase):
+    """Test suite for conditional requests to the posts and comments endpoints."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    def setUp(self):
+        self.post = PostFactory()
+        self.url = f"/posts/{self.post.pk}/"
+
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestPostConditionalGet.user)
+
+    def test_post_detail_not_modified(self):
+        """A matching ETag or Last-Modified is answered with 304."""
+        response = self.authorized_client.get(path=self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        for header, value in (
+            ('HTTP_IF_NONE_MATCH', response['ETag']),
+            ('HTTP_IF_MODIFIED_SINCE', response['Last-Modified']),
+        ):
+            with self.subTest(header=header):
+                not_modified = self.authorized_client.get(
+                    path=self.url, **{header: value}
+                )
+                self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
+                self.assertEqual(not_modified['ETag'], response['ETag'])
+
+    def test_post_detail_modified(self):
+        """Editing the post or commenting on it changes the ETag."""
+        etag = self.authorized_client.get(path=self.url)['ETag']
+
+        self.post.text = 'Новый текст'
+        self.post.save()
+        response = self.authorized_client.get(path=self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        etag = response['ETag']
+        CommentFactory(post=self.post)
+        response = self.authorized_client.get(path=self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_post_list_not_modified(self):
+        """The validators of a list page change when a post joins the page."""
+        response = self.authorized_client.get(path="/posts/")
+        not_modified = self.authorized_client.get(
+            path="/posts/", HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
+
+        PostFactory()
+        response = self.authorized_client.get(
+            path="/posts/", HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.data['results']), Post.objects.count())
+
+    def test_post_list_deletion(self):
+        """Lists are validated by ETag only, which a deletion changes."""
+        PostFactory()
+        response = self.authorized_client.get(path="/posts/")
+        self.assertNotIn('Last-Modified', response)
+
+        Post.objects.filter(pk=self.post.pk).delete()
+        response = self.authorized_client.get(
+            path="/posts/", HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_comment_detail_not_modified(self):
+        """Comment reads support conditional requests as well."""
+        url = f"/comments/{CommentFactory(post=self.post).pk}/"
+        response = self.authorized_client.get(path=url)
+        not_modified = self.authorized_client.get(
+            path=url, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(not_modified.status_code, HTTPStatus.NOT_MODIFIED)
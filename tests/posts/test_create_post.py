@@ -2,14 +2,13 @@ import random
 from datetime import datetime
 from http import HTTPStatus
 
-from django.conf import settings
-from django.test import TestCase
 from django.utils import timezone
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
-from posts.models import Post
+from posts.models import Post, ForbiddenWord
 from tests.factories import UserFactory
+from tests.utils import TestCase
 
 URL = "/posts/"
 
@@ -115,11 +114,13 @@ class TestPostCreate(TestCase):
 
     def test_create_post_title_with_forbidden_words(self):
         """Creating a new post by an unauthorised user with valid data."""
-        forbidden_words = settings.FORBIDDEN_WORDS
+        forbidden_word = random.choice(
+            ForbiddenWord.objects.values_list('word', flat=True)
+        )
         post_count = Post.objects.count()
 
         data = {
-            "title": f"Тестовый {random.choice(forbidden_words)}",
+            "title": f"Тестовый {forbidden_word}",
             "text": "Тестовый пост",
         }
 
@@ -130,7 +131,7 @@ class TestPostCreate(TestCase):
         )
         expected_response_data = {
             'title': [ErrorDetail(
-                string=f"Заголовок не должен содержать следующие слова: {', '.join(forbidden_words)}",
+                string=f"Заголовок не должен содержать следующие слова: {forbidden_word}",
                 code='invalid')]
         }
 
@@ -142,4 +143,31 @@ class TestPostCreate(TestCase):
                 title=data['title'],
                 text=data["text"],
             ).exists()
-        )
\ No newline at end of file
+        )
+
+    def test_create_post_text_with_forbidden_words(self):
+        """Creating a new post whose text contains forbidden words."""
+        forbidden_word = random.choice(
+            ForbiddenWord.objects.values_list('word', flat=True)
+        )
+        post_count = Post.objects.count()
+
+        data = {
+            "title": "Тестовый заголовок",
+            "text": f"Тестовый пост. {forbidden_word.upper()}!",
+        }
+
+        response = self.authorized_client.post(
+            path=URL,
+            data=data,
+            format='json',
+        )
+        expected_response_data = {
+            'text': [ErrorDetail(
+                string=f"Текст не должен содержать следующие слова: {forbidden_word}",
+                code='invalid')]
+        }
+
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(Post.objects.count(), post_count)
+        self.assertEqual(response.data, expected_response_data)
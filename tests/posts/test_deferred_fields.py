@@ -0,0 +1,62 @@
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase, forbid_deferred_loading
+
+
+class TestDeferredFields(TestCase):
+    """Test suite checking that the posts endpoints read only loaded columns."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    def setUp(self):
+        self.post = PostFactory(author=TestDeferredFields.user)
+        self.comment = CommentFactory(post=self.post, author=TestDeferredFields.user)
+        self.guest_client = APIClient()
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestDeferredFields.user)
+
+    def test_read_actions(self):
+        """Lists, details and searches render without loading deferred fields."""
+        for url in (
+            "/posts/",
+            f"/posts/{self.post.pk}/",
+            "/posts/?stream=json",
+            "/comments/",
+            f"/comments/{self.comment.pk}/",
+        ):
+            with self.subTest(url=url), forbid_deferred_loading():
+                response = self.guest_client.get(path=url)
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_read_actions_skip_search_vector(self):
+        """The search vector column is never fetched by the read actions."""
+        with CaptureQueriesContext(connection) as queries:
+            self.guest_client.get(path=f"/posts/{self.post.pk}/")
+            self.guest_client.get(path="/comments/")
+        self.assertNotIn('search_vector', ' '.join(q['sql'] for q in queries))
+
+    def test_update_and_destroy(self):
+        """The author check compares ids without loading the author."""
+        with CaptureQueriesContext(connection) as queries, forbid_deferred_loading():
+            response = self.authorized_client.patch(
+                path=f"/comments/{self.comment.pk}/", data={'text': 'новый текст'}
+            )
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            response = self.authorized_client.delete(path=f"/comments/{self.comment.pk}/")
+            self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+            response = self.authorized_client.delete(path=f"/posts/{self.post.pk}/")
+            self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        # only the request user is loaded, once per request
+        user_queries = [
+            q for q in queries
+            if q['sql'].startswith('SELECT') and 'FROM "users_user"' in q['sql']
+        ]
+        self.assertEqual(len(user_queries), 3)
@@ -1,10 +1,10 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.test import APIClient
 
 from posts.models import Comment, Post
 from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
 
 
 class TestPostDelete(TestCase):
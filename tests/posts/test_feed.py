@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from io import StringIO
+
+from dateutil.tz import UTC
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from posts.models import TimelineEntry
+from tests.factories import UserFactory, PostFactory
+from tests.utils import TestCase
+
+URL = "/feed/"
+
+
+class TestFeed(TestCase):
+    """Test suite for the feed of the posts of the followed authors."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+        cls.authors = UserFactory.create_batch(size=3)
+        cls.stranger = UserFactory()
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestFeed.user)
+        start = datetime(2023, 1, 1, tzinfo=UTC)
+        # interleave the posts of the authors, with ties on created
+        self.posts = [
+            PostFactory(
+                author=TestFeed.authors[i % 3],
+                created=start + timedelta(hours=i // 2),
+            )
+            for i in range(9)
+        ]
+        PostFactory.create_batch(size=3, author=TestFeed.stranger)
+
+    def follow(self, *authors):
+        for author in authors:
+            response = self.authorized_client.post(path=f"/users/{author.pk}/follow/")
+            self.assertEqual(response.status_code, HTTPStatus.CREATED)
+
+    def read_feed(self, page_size):
+        ids, url = [], f"{URL}?page_size={page_size}"
+        while url:
+            response = self.authorized_client.get(path=url)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            ids += [post['id'] for post in response.data['results']]
+            url = response.data['next']
+        return ids
+
+    def expected_ids(self):
+        return [
+            post.pk for post in sorted(
+                self.posts, key=lambda post: (post.created, post.pk), reverse=True
+            )
+        ]
+
+    def test_feed_merges_followed_authors(self):
+        """The feed pages through the posts of the followed authors only."""
+        self.follow(*TestFeed.authors)
+        for page_size in (1, 2, 4, 20):
+            with self.subTest(page_size=page_size):
+                self.assertListEqual(self.read_feed(page_size), self.expected_ids())
+
+    def test_unfollow(self):
+        """The posts of an unfollowed author leave the feed."""
+        self.follow(*TestFeed.authors)
+        response = self.authorized_client.delete(
+            path=f"/users/{TestFeed.authors[0].pk}/follow/"
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.posts = [
+            post for post in self.posts if post.author_id != TestFeed.authors[0].pk
+        ]
+        self.assertListEqual(self.read_feed(2), self.expected_ids())
+
+    def test_follow_self(self):
+        """A user cannot follow themselves."""
+        response = self.authorized_client.post(path=f"/users/{TestFeed.user.pk}/follow/")
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+
+    def test_feed_requires_authentication(self):
+        """Guests have no feed."""
+        response = APIClient().get(path=URL)
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_feed_reads_author_index(self):
+        """The merge reads the posts through the (author_id, created) index."""
+        self.follow(*TestFeed.authors)
+        with CaptureQueriesContext(connection) as queries:
+            self.authorized_client.get(path=f"{URL}?page_size=2")
+        sql = next(q['sql'] for q in queries if 'LATERAL' in q['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}')
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+        self.assertIn('posts_post_author_created_idx', plan)
+        self.assertNotIn('Seq Scan on posts_post', plan)
+
+    @override_settings(FEED_FANOUT_ON_WRITE=True)
+    def test_fan_out_on_write(self):
+        """The precomputed timeline gives the same feed."""
+        self.follow(*TestFeed.authors[:2])
+        # posted after following
+        self.posts.append(PostFactory(author=TestFeed.authors[0]))
+        self.follow(TestFeed.authors[2])
+        self.assertEqual(
+            TimelineEntry.objects.filter(user=TestFeed.user).count(), len(self.posts)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.assertListEqual(self.read_feed(2), self.expected_ids())
+        self.assertFalse(any('LATERAL' in q['sql'] for q in queries))
+
+        self.authorized_client.delete(path=f"/users/{TestFeed.authors[0].pk}/follow/")
+        self.posts = [
+            post for post in self.posts if post.author_id != TestFeed.authors[0].pk
+        ]
+        self.assertListEqual(self.read_feed(3), self.expected_ids())
+
+    def test_rebuild_timelines(self):
+        """The command backfills the timelines of the existing follows."""
+        self.follow(*TestFeed.authors)
+        with override_settings(FEED_FANOUT_ON_WRITE=True):
+            call_command('rebuild_timelines', batch_size=1, stdout=StringIO())
+            self.assertListEqual(self.read_feed(4), self.expected_ids())
@@ -0,0 +1,54 @@
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from posts.models import ForbiddenWord
+from posts.validators import ForbiddenWordsMatcher, check_content
+from tests.utils import TestCase
+
+
+class TestForbiddenWordsMatcher(SimpleTestCase):
+    """Test suite for the precompiled forbidden words matcher."""
+
+    def test_matcher_finds_words_case_insensitively(self):
+        """Words are found regardless of case, including Cyrillic."""
+        matcher = ForbiddenWordsMatcher(['ерунда', 'ерун', 'Чепуха'])
+        self.assertListEqual(
+            matcher.find('Полная ЕРУНДА, ерун и чепуха'),
+            ['ерунда', 'ерун', 'чепуха'],
+        )
+
+    def test_matcher_escapes_words(self):
+        """Regex metacharacters in the words are matched literally."""
+        matcher = ForbiddenWordsMatcher(['a.b', '(c'])
+        self.assertListEqual(matcher.find('axb (c'), ['(c'])
+
+    def test_matcher_without_words(self):
+        """An empty list of words matches nothing."""
+        self.assertListEqual(ForbiddenWordsMatcher([]).find('ерунда'), [])
+
+
+@override_settings(FORBIDDEN_WORDS_CHECK_INTERVAL=0)
+class TestForbiddenWordsReload(TestCase):
+    """Test suite for reloading the forbidden words stored in the database."""
+
+    def test_check_content_reloads_added_words(self):
+        """A word added in the database is forbidden once committed."""
+        check_content('Полный вздор')
+        with self.captureOnCommitCallbacks(execute=True):
+            ForbiddenWord.objects.create(word='Вздор')
+        with self.assertRaises(ValidationError):
+            check_content('Полный вздор')
+
+    def test_check_content_reloads_deleted_words(self):
+        """A word deleted from the database is allowed once committed."""
+        with self.assertRaises(ValidationError):
+            check_content('Полная ерунда')
+        with self.captureOnCommitCallbacks(execute=True):
+            ForbiddenWord.objects.get(word='ерунда').delete()
+        check_content('Полная ерунда')
+
+    def test_check_content_does_not_query_database(self):
+        """Validation reuses the compiled matcher while the version is unchanged."""
+        check_content('Тестовый заголовок')
+        with self.assertNumQueries(0):
+            check_content('Другой заголовок')
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from http import HTTPStatus
+from io import BytesIO, StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from tests.factories import UserFactory
+from tests.utils import TestCase
+
+URL = "/posts/"
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def image_bytes(color):
+    buffer = BytesIO()
+    Image.new('RGB', (400, 200), color=color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    MEDIA_GC_MIN_AGE=0,
+    POST_IMAGE_WORKERS=0,
+    POST_IMAGE_RENDITION_WIDTHS=(100,),
+    POST_IMAGE_RENDITION_FORMATS=('webp',),
+)
+class TestImageStorage(TestCase):
+    """Test suite for the content-addressed storage of the post images."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestImageStorage.user)
+
+    def create_post(self, content, client=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = (client or self.authorized_client).post(
+                path=URL,
+                data={
+                    'title': 'Заголовок',
+                    'text': 'Текст',
+                    'image': SimpleUploadedFile('Photo.PNG', content),
+                },
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        return Post.objects.get(pk=response.data['id'])
+
+    def delete(self, url, client=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = (client or self.authorized_client).delete(path=url)
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+
+    def exists(self, name):
+        return os.path.exists(os.path.join(MEDIA_ROOT, name))
+
+    def test_uploads_stored_under_digest(self):
+        """An upload is stored once under the SHA-256 of its content."""
+        content = image_bytes('red')
+        digest = hashlib.sha256(content).hexdigest()
+        first = self.create_post(content)
+        second = self.create_post(content)
+        self.assertEqual(first.image.name, f'posts/{digest[:2]}/{digest[2:4]}/{digest}.png')
+        self.assertEqual(second.image.name, first.image.name)
+        self.assertEqual(second.image_renditions, first.image_renditions)
+        self.assertTrue(self.exists(first.image.name))
+
+    def test_files_deleted_with_last_reference(self):
+        """The files are deleted when the last post using them is deleted."""
+        content = image_bytes('green')
+        first = self.create_post(content)
+        second = self.create_post(content)
+        names = [first.image.name, first.image_renditions[0]['name']]
+
+        self.delete(f"{URL}{first.pk}/")
+        self.assertTrue(all(self.exists(name) for name in names))
+        self.delete(f"{URL}{second.pk}/")
+        self.assertFalse(any(self.exists(name) for name in names))
+
+    def test_files_deleted_with_author(self):
+        """Posts deleted by CASCADE with their author release their files."""
+        author = UserFactory()
+        client = APIClient()
+        client.force_login(author)
+        post = self.create_post(image_bytes('blue'), client=client)
+
+        admin = APIClient()
+        admin.force_login(UserFactory(is_staff=True))
+        self.delete(f"/users/{author.pk}/", client=admin)
+        self.assertFalse(self.exists(post.image.name))
+
+    def test_replaced_image_is_released(self):
+        """Replacing the image releases the previous files."""
+        post = self.create_post(image_bytes('white'))
+        old_name = post.image.name
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.authorized_client.patch(
+                path=f"{URL}{post.pk}/",
+                data={'image': SimpleUploadedFile('new.png', image_bytes('black'))},
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertFalse(self.exists(old_name))
+        post.refresh_from_db()
+        self.assertTrue(self.exists(post.image.name))
+        self.assertEqual(len(post.image_renditions), 1)
+
+    @override_settings(MEDIA_GC_MIN_AGE=3600)
+    def test_recent_files_are_kept(self):
+        """Recently written files are left to the periodic collection."""
+        post = self.create_post(image_bytes('yellow'))
+        self.delete(f"{URL}{post.pk}/")
+        self.assertTrue(self.exists(post.image.name))
+
+    def test_gc_command(self):
+        """The command deletes the unreferenced files only."""
+        kept = self.create_post(image_bytes('orange'))
+        storage = Post._meta.get_field('image').storage
+        orphan = storage.save('posts/orphan.png', BytesIO(image_bytes('purple')))
+
+        call_command('gc_post_images', stdout=StringIO())
+        self.assertFalse(self.exists(orphan))
+        self.assertTrue(self.exists(kept.image.name))
+        self.assertTrue(self.exists(kept.image_renditions[0]['name']))
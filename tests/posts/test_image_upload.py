@@ -0,0 +1,106 @@
+import shutil
+import struct
+import tempfile
+import zlib
+from http import HTTPStatus
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from tests.factories import UserFactory
+from tests.utils import TestCase
+
+URL = "/posts/"
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_upload(image_format='PNG', size=(64, 32), mode='RGB'):
+    buffer = BytesIO()
+    Image.new(mode, size).save(buffer, image_format)
+    return SimpleUploadedFile(f'image.{image_format.lower()}', buffer.getvalue())
+
+
+def make_png_header(width, height):
+    """A valid PNG declaring a huge size, a few dozen bytes long."""
+    def chunk(chunk_type, data):
+        crc = zlib.crc32(chunk_type + data)
+        return struct.pack('>I', len(data)) + chunk_type + data + struct.pack('>I', crc)
+
+    header = struct.pack('>IIBBBBB', width, height, 1, 0, 0, 0, 0)
+    content = (
+        b'\x89PNG\r\n\x1a\n'
+        + chunk(b'IHDR', header)
+        + chunk(b'IDAT', zlib.compress(b'\x00'))
+        + chunk(b'IEND', b'')
+    )
+    return SimpleUploadedFile('bomb.png', content)
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, POST_IMAGE_WORKERS=0)
+class TestImageUpload(TestCase):
+    """Test suite for the limits of the post image uploads."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestImageUpload.user)
+
+    def upload(self, image):
+        return self.authorized_client.post(
+            path=URL,
+            data={'title': 'Заголовок', 'text': 'Текст', 'image': image},
+            format='multipart',
+        )
+
+    def test_valid_image_is_not_decoded(self):
+        """A valid image is accepted without verifying the whole bitmap."""
+        with mock.patch.object(Image.Image, 'verify', side_effect=AssertionError):
+            response = self.upload(make_upload())
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(Post.objects.get().image_width, 64)
+
+    @override_settings(FILE_UPLOAD_MAX_SIZE=1024)
+    def test_oversized_upload_is_stopped_while_streaming(self):
+        """The upload handler stops reading a file over the byte limit."""
+        response = self.upload(SimpleUploadedFile('big.png', b'0' * 200_000))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('Multipart form parse error', response.data['detail'])
+        self.assertFalse(Post.objects.exists())
+
+    @override_settings(IMAGE_MAX_PIXELS=100 * 100)
+    def test_too_many_pixels(self):
+        """Images over the pixel limit are rejected."""
+        response = self.upload(make_upload(size=(200, 100), mode='1'))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data['image'][0].code, 'too_many_pixels')
+
+    def test_decompression_bomb(self):
+        """A tiny file declaring a huge bitmap is rejected from its header."""
+        response = self.upload(make_png_header(100_000, 100_000))
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data['image'][0].code, 'too_many_pixels')
+
+    def test_invalid_formats(self):
+        """Files that are not images of the allowed formats are rejected."""
+        for upload in (
+            SimpleUploadedFile('text.png', b'not an image'),
+            make_upload(image_format='BMP'),
+        ):
+            with self.subTest(name=upload.name):
+                response = self.upload(upload)
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+                self.assertEqual(response.data['image'][0].code, 'invalid_format')
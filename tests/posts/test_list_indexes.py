@@ -0,0 +1,62 @@
+from django.db import connection
+
+from posts.models import Post, Comment
+from posts.pagination import KeysetCursorPagination
+from tests.factories import PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestListIndexes(TestCase):
+    """Test suite checking that the filtered list queries are served by indexes."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.post = PostFactory()
+        CommentFactory.create_batch(size=5, post=cls.post)
+
+    def setUp(self):
+        # the test tables are tiny, make the planner ignore the cheaper full scans
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute('SET LOCAL enable_bitmapscan = off')
+            cursor.execute('SET LOCAL enable_sort = off')
+
+    def assertUsesIndex(self, queryset, index_name):
+        page_size = KeysetCursorPagination.page_size
+        plan = queryset.order_by(
+            *KeysetCursorPagination.ordering
+        )[:page_size + 1].explain()
+        self.assertIn(f'Index Scan using {index_name}', plan)
+        self.assertNotIn('Sort', plan)
+
+        # a following page seeks into the index from the cursor
+        paginator = KeysetCursorPagination()
+        position = paginator._get_position_from_instance(
+            queryset.order_by(*paginator.ordering).first(), paginator.ordering
+        )
+        plan = paginator.get_page_queryset(queryset, position, reverse=False)[
+            :page_size + 1
+        ].explain()
+        self.assertIn(f'Index Scan using {index_name}', plan)
+        self.assertRegex(plan, r'Index Cond: .*ROW\(created, id\) <')
+        self.assertNotIn('Filter', plan)
+        self.assertNotIn('Sort', plan)
+
+    def test_posts_use_index(self):
+        """The list query scans the (-created, -id) index."""
+        self.assertUsesIndex(Post.objects.all(), 'posts_post_created_id_idx')
+
+    def test_posts_by_author_use_index(self):
+        """The ?user= list query scans the (author_id, -created, -id) index."""
+        self.assertUsesIndex(
+            Post.objects.filter(author=TestListIndexes.post.author_id),
+            'posts_post_author_created_idx',
+        )
+
+    def test_comments_by_post_use_index(self):
+        """The ?post= list query scans the (post_id, -created, -id) index."""
+        self.assertUsesIndex(
+            Comment.objects.filter(post=TestListIndexes.post.pk),
+            'posts_comment_post_created_idx',
+        )
@@ -0,0 +1,67 @@
+from datetime import datetime
+from http import HTTPStatus
+
+from dateutil.tz import UTC
+from rest_framework.test import APIClient
+
+from posts.models import Post
+from tests.factories import PostFactory
+from tests.utils import TestCase
+
+
+class TestPostPagination(TestCase):
+    """Test suite for the keyset pagination of the posts list."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        PostFactory.create_batch(size=25)
+        # half of the posts share the same timestamp to exercise the id tiebreaker
+        tied_ids = Post.objects.values_list('pk', flat=True)[:13]
+        Post.objects.filter(pk__in=list(tied_ids)).update(
+            created=datetime(2020, 1, 1, tzinfo=UTC)
+        )
+        cls.url = "/posts/?page_size=7"
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+    def test_pages_cover_all_posts_in_order(self):
+        """Walking the next links returns every post once in -created, -id order."""
+        expected_ids = list(
+            Post.objects.order_by('-created', '-id').values_list('pk', flat=True)
+        )
+        received_ids = []
+        url = TestPostPagination.url
+        while url:
+            response = self.guest_client.get(path=url)
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            received_ids += [post['id'] for post in response.data['results']]
+            url = response.data['next']
+        self.assertListEqual(received_ids, expected_ids)
+
+    def test_previous_link_returns_previous_page(self):
+        """The previous link of the second page returns the first page."""
+        first_page = self.guest_client.get(path=TestPostPagination.url).data
+        second_page = self.guest_client.get(path=first_page['next']).data
+        response = self.guest_client.get(path=second_page['previous'])
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(response.data['results'], first_page['results'])
+        self.assertIsNone(response.data['previous'])
+
+    def test_page_is_stable_under_inserts(self):
+        """Posts added after the first page do not shift the following pages."""
+        first_page = self.guest_client.get(path=TestPostPagination.url).data
+        expected = self.guest_client.get(path=first_page['next']).data['results']
+        # invalidates the cached pages, so they are queried again
+        with self.captureOnCommitCallbacks(execute=True):
+            PostFactory.create_batch(size=3)
+        new_first_page = self.guest_client.get(path=TestPostPagination.url).data
+        self.assertNotEqual(new_first_page['results'], first_page['results'])
+        response = self.guest_client.get(path=first_page['next'])
+        self.assertListEqual(response.data['results'], expected)
+
+    def test_invalid_cursor(self):
+        """A malformed cursor is reported as not found."""
+        response = self.guest_client.get(path="/posts/?cursor=broken")
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
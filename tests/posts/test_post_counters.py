@@ -0,0 +1,83 @@
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from posts.models import Post, Comment
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestPostCounters(TestCase):
+    """Test suite for the denormalized comment counters of a post."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    def setUp(self):
+        self.post = PostFactory()
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestPostCounters.user)
+
+    def test_counters_follow_comment_create(self):
+        """Creating a comment increments the count and moves the last activity."""
+        response = self.authorized_client.post(
+            path="/comments/",
+            data={"text": "Тестовый комментарий", "post": self.post.pk},
+            format='json',
+        )
+        comment = Comment.objects.get(pk=response.data['id'])
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertEqual(self.post.last_commented_at, comment.created)
+
+    def test_counters_follow_comment_delete(self):
+        """Deleting the latest comment restores the previous last activity."""
+        first, last = CommentFactory.create_batch(size=2, post=self.post)
+        Comment.objects.filter(pk=last.pk).delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertEqual(self.post.last_commented_at, first.created)
+
+        Comment.objects.filter(pk=first.pk).delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 0)
+        self.assertIsNone(self.post.last_commented_at)
+
+    def test_counters_follow_bulk_create(self):
+        """A multi-row insert updates every affected post."""
+        other_post = PostFactory()
+        Comment.objects.bulk_create([
+            Comment(post=post, author=TestPostCounters.user, text='комментарий')
+            for post in (self.post, self.post, other_post)
+        ])
+        self.assertQuerysetEqual(
+            Post.objects.filter(pk__in=(self.post.pk, other_post.pk)).order_by('pk'),
+            [2, 1],
+            transform=lambda post: post.comment_count,
+        )
+
+    def test_rebuild_post_counters_command(self):
+        """The management command recomputes drifted counters."""
+        comments = CommentFactory.create_batch(size=3, post=self.post)
+        Post.objects.filter(pk=self.post.pk).update(
+            comment_count=0, last_commented_at=None
+        )
+        call_command('rebuild_post_counters', batch_size=1, stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 3)
+        self.assertEqual(
+            self.post.last_commented_at, max(c.created for c in comments)
+        )
+
+    def test_save_keeps_counters(self):
+        """Saving a post loaded before a comment does not overwrite the counters."""
+        stale_post = Post.objects.get(pk=self.post.pk)
+        CommentFactory(post=self.post)
+        stale_post.title = 'Заголовок'
+        stale_post.save()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertIsNotNone(self.post.last_commented_at)
@@ -1,11 +1,11 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.test import APIClient
 
 from posts.models import Comment
 from posts.serializers import PostDetailSerializer
 from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
 
 
 class TestPostDetail(TestCase):
@@ -19,6 +19,7 @@ class TestPostDetail(TestCase):
         cls.url = f"/posts/{cls.post.pk}/"
         CommentFactory.create_batch(size=5, post=cls.post)
         CommentFactory.create_batch(size=5, post=PostFactory(title='another_post'))
+        cls.post.refresh_from_db()
 
     def setUp(self):
         self.guest_client = APIClient()
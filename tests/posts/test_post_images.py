@@ -0,0 +1,145 @@
+import shutil
+import tempfile
+from http import HTTPStatus
+from io import BytesIO, StringIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from posts.images import create_renditions
+from posts.models import Post
+from tests.factories import UserFactory, PostFactory
+from tests.utils import TestCase
+
+URL = "/posts/"
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def make_image(size=(800, 400), image_format='JPEG', orientation=None):
+    image = Image.new('RGB', size, color=(200, 30, 30))
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[0x0112] = orientation
+    buffer = BytesIO()
+    image.save(buffer, image_format, exif=exif)
+    return SimpleUploadedFile(
+        f'image.{image_format.lower()}',
+        buffer.getvalue(),
+        content_type=f'image/{image_format.lower()}',
+    )
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT,
+    POST_IMAGE_WORKERS=0,
+    POST_IMAGE_RENDITION_WIDTHS=(320, 640, 1280),
+    POST_IMAGE_RENDITION_FORMATS=('webp',),
+)
+class TestPostImages(TestCase):
+    """Test suite for the renditions of the post images."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestPostImages.user)
+
+    def create_post(self, image):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.authorized_client.post(
+                path=URL,
+                data={'title': 'Заголовок', 'text': 'Текст', 'image': image},
+                format='multipart',
+            )
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        return Post.objects.get(pk=response.data['id'])
+
+    def test_renditions_created_on_upload(self):
+        """An upload stores the dimensions and the narrower renditions."""
+        post = self.create_post(make_image(size=(800, 400)))
+        self.assertEqual((post.image_width, post.image_height), (800, 400))
+        self.assertListEqual(
+            [(r['format'], r['width'], r['height']) for r in post.image_renditions],
+            [('webp', 320, 160), ('webp', 640, 320)],
+        )
+        for rendition in post.image_renditions:
+            with post.image.storage.open(rendition['name']) as file, Image.open(file) as image:
+                self.assertEqual(image.format, 'WEBP')
+                self.assertEqual(image.size, (rendition['width'], rendition['height']))
+
+    def test_orientation_applied_and_exif_stripped(self):
+        """The EXIF rotation is applied to the pixels and the EXIF dropped."""
+        post = self.create_post(make_image(size=(800, 400), orientation=6))
+        rendition = post.image_renditions[0]
+        self.assertEqual((rendition['width'], rendition['height']), (320, 640))
+        with post.image.storage.open(rendition['name']) as file, Image.open(file) as image:
+            self.assertFalse(image.getexif())
+
+    def test_small_image_single_rendition(self):
+        """An image narrower than every width is converted at its own width."""
+        post = self.create_post(make_image(size=(100, 50), image_format='PNG'))
+        self.assertListEqual(
+            [(r['width'], r['height']) for r in post.image_renditions], [(100, 50)]
+        )
+
+    def test_detail_exposes_rendition_urls(self):
+        """The post detail lists the rendition URLs."""
+        post = self.create_post(make_image())
+        response = APIClient().get(path=f"{URL}{post.pk}/")
+        self.assertEqual(response.data['image_width'], 800)
+        renditions = response.data['image_renditions']
+        self.assertEqual(len(renditions), 2)
+        self.assertTrue(
+            renditions[0]['url'].startswith('http://testserver/media/posts/renditions/')
+        )
+
+    def test_replaced_image_is_skipped(self):
+        """A task for an image that was replaced in the meantime does nothing."""
+        post = self.create_post(make_image())
+        create_renditions(post.pk, 'posts/replaced.jpg')
+        post.refresh_from_db()
+        self.assertEqual(len(post.image_renditions), 2)
+
+    def test_renditions_change_etag_only(self):
+        """Adding the renditions changes the ETag of the post, not its updated."""
+        post = PostFactory(image=make_image())
+        response = APIClient().get(path=f"{URL}{post.pk}/")
+        self.assertEqual(response.data['image_renditions'], [])
+
+        create_renditions(post.pk, post.image.name)
+
+        response = APIClient().get(
+            path=f"{URL}{post.pk}/", HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(response.data['image_renditions']), 2)
+        self.assertEqual(Post.objects.get(pk=post.pk).updated, post.updated)
+
+    def test_save_keeps_renditions(self):
+        """Saving a post loaded before its renditions does not drop them."""
+        post = PostFactory(image=make_image())
+        create_renditions(post.pk, post.image.name)
+        post.title = 'Заголовок'
+        post.save()
+        post.refresh_from_db()
+        self.assertEqual(len(post.image_renditions), 2)
+
+    def test_rebuild_post_renditions(self):
+        """The command processes the images of existing posts."""
+        post = PostFactory(image=make_image(size=(700, 700)))
+        Post.objects.filter(pk=post.pk).update(image_width=None, image_height=None)
+        call_command('rebuild_post_renditions', stdout=StringIO())
+        post.refresh_from_db()
+        self.assertEqual((post.image_width, post.image_height), (700, 700))
+        self.assertEqual(len(post.image_renditions), 2)
@@ -0,0 +1,37 @@
+from rest_framework.test import APIClient
+
+from tests.factories import PostFactory, CommentFactory
+from tests.utils import TestCase
+
+URL = "/posts/"
+
+
+class TestPostQueries(TestCase):
+    """Test suite for the number of queries run by the posts endpoints."""
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+    def create_posts(self, size):
+        posts = PostFactory.create_batch(size=size)
+        for post in posts:
+            CommentFactory.create_batch(size=3, post=post)
+        return posts
+
+    def test_post_list_queries_do_not_depend_on_page_size(self):
+        """The posts list loads the comment ids of the page in one query."""
+        for size in (1, 5, 20):
+            with self.subTest(size=size):
+                self.create_posts(size)
+                # the page validators, the page of posts and its comment ids
+                with self.assertNumQueries(3):
+                    response = self.guest_client.get(path=f"{URL}?page_size={size}")
+                self.assertEqual(len(response.data['results']), size)
+
+    def test_post_detail_queries(self):
+        """A single post is loaded together with its comment ids in three queries."""
+        post = self.create_posts(1)[0]
+        # the post validators, the post and its comment ids
+        with self.assertNumQueries(3):
+            response = self.guest_client.get(path=f"{URL}{post.pk}/")
+        self.assertEqual(len(response.data['comments']), 3)
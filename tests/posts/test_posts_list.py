@@ -1,10 +1,10 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.test import APIClient
 
 from posts.models import Post
 from tests.factories import UserFactory, PostFactory
+from tests.utils import TestCase
 
 
 class TestPostList(TestCase):
@@ -27,10 +27,10 @@ class TestPostList(TestCase):
         """Test for retrieving a list of posts by an authorised user."""
         response = self.authorized_client.get(path=TestPostList.url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.assertEqual(len(response.data), Post.objects.count())
+        self.assertEqual(len(response.data['results']), Post.objects.count())
 
     def test_user_list_unauthorised(self):
         """Test for retrieving a list of posts by an unauthorised user."""
         response = self.guest_client.get(path=TestPostList.url)
         self.assertEqual(response.status_code, HTTPStatus.OK)
-        self.assertEqual(len(response.data), Post.objects.count())
+        self.assertEqual(len(response.data['results']), Post.objects.count())
@@ -0,0 +1,99 @@
+from http import HTTPStatus
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory, PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestResponseCache(TestCase):
+    """Test suite for the cache of anonymous post and comment reads."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+
+    def setUp(self):
+        cache.clear()
+        self.post = PostFactory()
+        self.url = f"/posts/{self.post.pk}/"
+        self.guest_client = APIClient()
+
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestResponseCache.user)
+
+    def test_anonymous_read_is_cached(self):
+        """A repeated anonymous read does not touch the database."""
+        first = self.guest_client.get(path=self.url)
+        with self.assertNumQueries(0):
+            second = self.guest_client.get(path=self.url)
+        self.assertEqual(second.status_code, HTTPStatus.OK)
+        self.assertEqual(second.data, first.data)
+
+    def test_authorised_read_is_not_cached(self):
+        """Reads of authenticated users always hit the database."""
+        self.authorized_client.get(path=self.url)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.authorized_client.get(path=self.url)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertIn('posts_post', ' '.join(q['sql'] for q in queries))
+
+    def test_post_save_invalidates_detail_and_list(self):
+        """Saving a post invalidates its detail and the posts list."""
+        self.guest_client.get(path=self.url)
+        self.guest_client.get(path="/posts/")
+
+        # the versions are bumped once the change commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.post.title = 'Новый заголовок'
+            self.post.save()
+
+        self.assertEqual(
+            self.guest_client.get(path=self.url).data['title'], 'Новый заголовок'
+        )
+        self.assertEqual(
+            self.guest_client.get(path="/posts/").data['results'][0]['title'],
+            'Новый заголовок',
+        )
+
+    def test_comment_changes_invalidate_post(self):
+        """Creating and deleting a comment invalidates the post it belongs to."""
+        self.guest_client.get(path=self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            comment = CommentFactory(post=self.post)
+        response = self.guest_client.get(path=self.url)
+        self.assertListEqual(response.data['comments'], [comment.pk])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            comment.delete()
+        response = self.guest_client.get(path=self.url)
+        self.assertListEqual(response.data['comments'], [])
+
+    def test_invalidated_after_commit(self):
+        """The versions are not bumped before the change commits."""
+        self.guest_client.get(path=self.url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.post.title = 'Новый заголовок'
+            self.post.save()
+            # a reader during the transaction keeps the committed response
+            self.guest_client.get(path=self.url)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(
+            self.guest_client.get(path=self.url).data['title'], 'Новый заголовок'
+        )
+
+    def test_conditional_request(self):
+        """A request with a matching If-None-Match gets 304 Not Modified."""
+        response = self.guest_client.get(path=self.url)
+        self.assertIn('Last-Modified', response)
+
+        response = self.guest_client.get(
+            path=self.url, HTTP_IF_NONE_MATCH=response['ETag']
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
@@ -0,0 +1,76 @@
+from http import HTTPStatus
+
+from rest_framework.test import APIClient
+
+from tests.factories import PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestSearch(TestCase):
+    """Test suite for the full-text search of posts and comments."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.title_match = PostFactory(title='коты и собаки', text='о домашних животных')
+        cls.text_match = PostFactory(title='заметки', text='мои коты спят весь день')
+        cls.other = PostFactory(title='погода', text='завтра будет дождь')
+        cls.comment = CommentFactory(post=cls.other, text='котов тоже любят дождь')
+        CommentFactory(post=cls.other, text='солнце')
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+    def test_search_posts_ranked(self):
+        """Word forms match, and a title match ranks above a text match."""
+        response = self.guest_client.get(path="/posts/search/", data={"q": "кот"})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(
+            [post['id'] for post in response.data['results']],
+            [TestSearch.title_match.pk, TestSearch.text_match.pk],
+        )
+
+    def test_search_posts_paginated(self):
+        """The results are paginated by cursor."""
+        response = self.guest_client.get(
+            path="/posts/search/", data={"q": "кот", "page_size": 1}
+        )
+        self.assertEqual(
+            response.data['results'][0]['id'], TestSearch.title_match.pk
+        )
+
+        response = self.guest_client.get(path=response.data['next'])
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(
+            [post['id'] for post in response.data['results']],
+            [TestSearch.text_match.pk],
+        )
+        self.assertIsNone(response.data['next'])
+
+    def test_search_follows_updates(self):
+        """The search vector is updated together with the text."""
+        post = TestSearch.other
+        post.text = 'сегодня светит солнце'
+        post.save()
+
+        response = self.guest_client.get(path="/posts/search/", data={"q": "солнце"})
+        self.assertListEqual(
+            [post['id'] for post in response.data['results']], [post.pk]
+        )
+
+    def test_search_comments(self):
+        """Comments are searched by their text."""
+        response = self.guest_client.get(
+            path="/comments/search/", data={"q": "коты дождь"}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual(
+            [comment['id'] for comment in response.data['results']],
+            [TestSearch.comment.pk],
+        )
+        self.assertNotIn('search_vector', response.data['results'][0])
+
+    def test_search_without_query(self):
+        """A search without a query is rejected."""
+        response = self.guest_client.get(path="/posts/search/?q=")
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
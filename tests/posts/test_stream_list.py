@@ -0,0 +1,57 @@
+import json
+from http import HTTPStatus
+
+from rest_framework.test import APIClient
+
+from posts.models import Post, Comment
+from posts.serializers import PostDetailSerializer
+from tests.factories import PostFactory, CommentFactory
+from tests.utils import TestCase
+
+
+class TestStreamList(TestCase):
+    """Test suite for streaming the posts and comments lists."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        for post in PostFactory.create_batch(size=25):
+            CommentFactory.create_batch(size=2, post=post)
+
+    def setUp(self):
+        self.guest_client = APIClient()
+
+    def test_stream_posts_ndjson(self):
+        """Every post is streamed as one JSON line, past the page size."""
+        response = self.guest_client.get(path="/posts/?stream=ndjson")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).decode().splitlines()
+        ]
+        expected = PostDetailSerializer(Post.objects.all(), many=True).data
+        self.assertEqual(len(rows), Post.objects.count())
+        self.assertEqual(rows, json.loads(json.dumps(expected)))
+
+    def test_stream_comments_json(self):
+        """The comments are streamed as a single JSON array."""
+        response = self.guest_client.get(path="/comments/?stream=json")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(len(rows), Comment.objects.count())
+
+    def test_stream_filtered_list(self):
+        """The list filters apply to streamed lists."""
+        post = Post.objects.first()
+        response = self.guest_client.get(path=f"/comments/?post={post.pk}&stream=json")
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual({row['post'] for row in rows}, {post.pk})
+
+    def test_stream_unknown_format(self):
+        """An unknown stream format is rejected."""
+        response = self.guest_client.get(path="/posts/?stream=xml")
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
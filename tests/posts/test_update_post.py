@@ -1,13 +1,12 @@
 import random
 from http import HTTPStatus
 
-from django.conf import settings
-from django.test import TestCase
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
-from posts.models import Post
+from posts.models import Post, ForbiddenWord
 from tests.factories import PostFactory, UserFactory
+from tests.utils import TestCase
 
 
 class TestPostUpdate(TestCase):
@@ -134,10 +133,12 @@ class TestPostUpdate(TestCase):
 
         """
         post = TestPostUpdate.post
-        forbidden_words = settings.FORBIDDEN_WORDS
+        forbidden_word = random.choice(
+            ForbiddenWord.objects.values_list('word', flat=True)
+        )
 
         data = {
-            "title": f"Тестовый {random.choice(forbidden_words)}",
+            "title": f"Тестовый {forbidden_word}",
         }
 
         response = self.authorized_client.patch(
@@ -147,7 +148,7 @@ class TestPostUpdate(TestCase):
         )
         expected_response_data = {
             'title': [ErrorDetail(
-                string=f"Заголовок не должен содержать следующие слова: {', '.join(forbidden_words)}",
+                string=f"Заголовок не должен содержать следующие слова: {forbidden_word}",
                 code='invalid')]
         }
         self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
@@ -0,0 +1,54 @@
+from datetime import date
+from http import HTTPStatus
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory
+from tests.utils import TestCase
+from users.models import AdultSince, User
+
+
+class TestAdultSince(TestCase):
+    """Test suite for the precomputed date users may post from."""
+
+    def setUp(self):
+        self.leap_day_user = UserFactory(birthday=date(2004, 2, 29))
+        self.today = date.today()
+        self.minor = UserFactory(birthday=self.today.replace(year=self.today.year - 10))
+
+    def test_computed_on_save(self):
+        """adult_since is the USER_MIN_AGE birthday, also for partial saves."""
+        self.assertEqual(self.leap_day_user.adult_since, date(2022, 2, 28))
+        self.leap_day_user.birthday = date(2010, 5, 1)
+        self.leap_day_user.save(update_fields=['birthday'])
+        self.leap_day_user.refresh_from_db()
+        self.assertEqual(self.leap_day_user.adult_since, date(2028, 5, 1))
+
+    def test_sql_matches_python(self):
+        """The backfill expression gives the same dates as the model."""
+        users = User.objects.annotate(computed=AdultSince()).values_list(
+            'adult_since', 'computed'
+        )
+        for adult_since, computed in users:
+            self.assertEqual(adult_since, computed)
+
+    def test_backfill_command(self):
+        """The command recomputes the dates after a change of USER_MIN_AGE."""
+        with override_settings(USER_MIN_AGE=21):
+            call_command('backfill_adult_since', batch_size=1, stdout=StringIO())
+        self.leap_day_user.refresh_from_db()
+        self.assertEqual(self.leap_day_user.adult_since, date(2025, 2, 28))
+
+    def test_list_filter(self):
+        """The users list can be filtered by whether the users may post."""
+        client = APIClient()
+        client.force_login(self.leap_day_user)
+        response = client.get(path='/users/?adult=true')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertListEqual([user['id'] for user in response.data], [self.leap_day_user.pk])
+
+        response = client.get(path='/users/?adult=false')
+        self.assertListEqual([user['id'] for user in response.data], [self.minor.pk])
@@ -0,0 +1,121 @@
+import os
+import tempfile
+from http import HTTPStatus
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory
+from tests.utils import TestCase
+from users import serializers
+from users.models import User, get_adult_since
+
+URL = "/users/bulk/"
+
+
+def user_data(n):
+    return {
+        'username': f'imported{n}',
+        'password': f'kjfrhU78{n}',
+        'birthday': '1990-01-01',
+        'email': 'user@mail.ru',
+    }
+
+
+@override_settings(PASSWORD_HASHING_WORKERS=2, PASSWORD_HASHING_ITERATIONS=1000)
+class TestUserBulkCreate(TestCase):
+    """Test suite for provisioning users in bulk."""
+
+    def setUp(self):
+        self.admin_client = APIClient()
+        self.admin_client.force_login(UserFactory(is_staff=True))
+
+    def test_bulk_create(self):
+        """The users are inserted at once with hashed passwords."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.admin_client.post(
+                path=URL, data=[user_data(n) for n in range(5)], format='json'
+            )
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(len(response.data), 5)
+        self.assertNotIn('password', response.data[0])
+        inserts = [q for q in queries if q['sql'].startswith('INSERT INTO "users_user"')]
+        self.assertEqual(len(inserts), 1)
+
+        user = User.objects.get(username='imported3')
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(check_password('kjfrhU783', user.password))
+        self.assertEqual(user.adult_since, get_adult_since(user.birthday))
+
+    def test_bulk_create_admins_only(self):
+        """Only admins can provision users."""
+        client = APIClient()
+        client.force_login(UserFactory())
+        response = client.post(path=URL, data=[user_data(0)], format='json')
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+    def test_invalid_item_creates_nothing(self):
+        """Nothing is created if any user is invalid."""
+        data = [user_data(0), {**user_data(1), 'password': 'weak'}]
+        response = self.admin_client.post(path=URL, data=data, format='json')
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertIn('password', response.data[1])
+        self.assertFalse(User.objects.filter(username='imported0').exists())
+
+    def test_duplicates_in_list_rejected(self):
+        """Users repeating a username or phone number of the list are rejected."""
+        for field, value in (('username', 'imported0'), ('phone_number', '+79161234567')):
+            with self.subTest(field=field):
+                data = [{**user_data(n), field: value} for n in range(3)]
+                response = self.admin_client.post(path=URL, data=data, format='json')
+                self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+                self.assertIn(field, response.data)
+                self.assertFalse(User.objects.filter(username__startswith='imported').exists())
+
+    def test_passwords_hashed_before_transaction(self):
+        """No transaction is held open while the passwords are hashed."""
+        depths = []
+        outer = len(connection.atomic_blocks)
+        original = serializers.hash_passwords
+
+        def hash_passwords(*args, **kwargs):
+            depths.append(len(connection.atomic_blocks))
+            return original(*args, **kwargs)
+
+        with mock.patch.object(serializers, 'hash_passwords', hash_passwords):
+            response = self.admin_client.post(
+                path=URL, data=[user_data(n) for n in range(2)], format='json'
+            )
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertEqual(depths, [outer])
+
+    def test_provision_users_command(self):
+        """The command creates the valid users of a CSV file."""
+        fd, path = tempfile.mkstemp(suffix='.csv')
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'w') as file:
+            file.write('username,password,birthday,email,phone_number\n')
+            for n in range(3):
+                file.write('{username},{password},{birthday},{email},\n'.format(**user_data(n)))
+            file.write('imported0,password0,1990-01-01,\n')
+            file.write('broken,short,1990-01-01,\n')
+            file.write('imported3,kjfrhU783,1990-01-01,,+79161234567\n')
+            file.write('imported4,kjfrhU784,1990-01-01,,+79161234567\n')
+
+        stderr = StringIO()
+        call_command(
+            'provision_users', path, batch_size=3, iterations=500, workers=2,
+            stdout=StringIO(), stderr=stderr,
+        )
+        self.assertEqual(User.objects.filter(username__startswith='imported').count(), 4)
+        self.assertIn('Line 5', stderr.getvalue())
+        self.assertIn('Line 6', stderr.getvalue())
+        self.assertIn('Line 8: duplicate phone_number', stderr.getvalue())
+        user = User.objects.get(username='imported2')
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$500$'))
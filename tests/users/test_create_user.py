@@ -2,10 +2,10 @@ from http import HTTPStatus
 import random
 
 from django.conf import settings
-from django.test import TestCase
 from rest_framework.test import APIClient
 from rest_framework.exceptions import ErrorDetail
 
+from tests.utils import TestCase
 from users.models import User
 
 ALLOWED_DOMAINS = settings.ALLOWED_EMAIL_DOMAINS
@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+from django.contrib.auth.password_validation import (get_default_password_validators,
+                                                     validate_password)
+from django.core.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from tests.utils import TestCase
+from users.validators import CommonPasswordValidator
+
+URL = "/users/"
+
+
+class TestPasswordValidation(TestCase):
+    """Test suite for the password validation shared by the API and Django."""
+
+    def register(self, password):
+        return APIClient().post(
+            path=URL,
+            data={
+                'username': 'new_user',
+                'birthday': '1990-01-01',
+                'email': 'user@mail.ru',
+                'password': password,
+            },
+            format='json',
+        )
+
+    def test_common_password_rejected(self):
+        """A strong but common password is rejected at registration."""
+        response = self.register('password1')
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data['password'][0].code, 'password_too_common')
+
+    def test_weak_password_single_error(self):
+        """A weak password is reported once, by the strength rule."""
+        response = self.register('12345')
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(
+            [error.code for error in response.data['password']], ['password_is_weak']
+        )
+
+    def test_similar_password_rejected(self):
+        """The password is compared with the attributes of the new user."""
+        response = self.register('new_user1')
+        self.assertEqual(response.status_code, HTTPStatus.BAD_REQUEST)
+        self.assertEqual(response.data['password'][0].code, 'password_too_similar')
+
+    def test_django_validators_share_rule(self):
+        """AUTH_PASSWORD_VALIDATORS check the strength rule of the API."""
+        with self.assertRaises(ValidationError) as context:
+            validate_password('kjfrhsdkdkkdd')
+        self.assertIn('password_is_weak', [error.code for error in context.exception.error_list])
+        self.assertIn("This password is not strong.", context.exception.messages)
+
+    def test_common_passwords_loaded_once(self):
+        """The common passwords are preloaded once into a shared frozenset."""
+        [preloaded] = [
+            validator for validator in get_default_password_validators()
+            if isinstance(validator, CommonPasswordValidator)
+        ]
+        self.assertIsInstance(preloaded.passwords, frozenset)
+        self.assertIs(CommonPasswordValidator().passwords, preloaded.passwords)
@@ -0,0 +1,90 @@
+from datetime import date
+from http import HTTPStatus
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from posts.models import Post
+from tests.factories import UserFactory
+from tests.utils import TestCase
+
+PASSWORD = 'password123'
+
+
+class TestTokenClaims(TestCase):
+    """Test suite for authenticating with the claims of the access token."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.user.set_password(PASSWORD)
+        self.user.save()
+        self.client = APIClient()
+        self.tokens = self.login(self.user)
+
+    def login(self, user):
+        response = self.client.post(
+            path='/login/', data={'username': user.username, 'password': PASSWORD}
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        return response.data
+
+    def authenticate(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+    def create_post(self):
+        return self.client.post(path='/posts/', data={'title': 'Заголовок', 'text': 'Текст'})
+
+    def test_claims_in_token(self):
+        """The access token carries the fields read by the permissions."""
+        token = AccessToken(self.tokens['access'])
+        self.assertEqual(token['adult_since'], self.user.adult_since.isoformat())
+        self.assertIs(token['is_staff'], False)
+        self.assertIs(token['is_active'], True)
+
+    def test_write_without_user_query(self):
+        """Creating a post does not load the user row."""
+        self.authenticate(self.tokens['access'])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.create_post()
+        self.assertEqual(response.status_code, HTTPStatus.CREATED)
+        self.assertFalse(any('FROM "users_user"' in q['sql'] for q in queries))
+        self.assertEqual(Post.objects.get(pk=response.data['id']).author_id, self.user.pk)
+
+    def test_deactivated_user_rejected(self):
+        """Deactivating a user invalidates the claims of their tokens."""
+        self.authenticate(self.tokens['access'])
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.create_post().status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_deactivated_with_update_fields_rejected(self):
+        """Saving only is_active also invalidates the claims of the tokens."""
+        self.authenticate(self.tokens['access'])
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+        self.assertEqual(self.create_post().status_code, HTTPStatus.UNAUTHORIZED)
+
+    def test_refresh_reloads_claims(self):
+        """A refreshed access token carries the current fields of the user."""
+        self.user.birthday = date.today().replace(year=date.today().year - 10)
+        self.user.save()
+        self.client.credentials()
+        response = self.client.post(path='/refresh/', data={'refresh': self.tokens['refresh']})
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(
+            AccessToken(response.data['access'])['adult_since'], self.user.adult_since.isoformat()
+        )
+
+        # the new token is not stale, and is denied by its claims
+        self.authenticate(response.data['access'])
+        self.assertEqual(self.create_post().status_code, HTTPStatus.FORBIDDEN)
+
+    def test_refresh_of_deleted_user_rejected(self):
+        """The tokens of a deleted user cannot be refreshed."""
+        self.user.delete()
+        response = self.client.post(path='/refresh/', data={'refresh': self.tokens['refresh']})
+        self.assertEqual(response.status_code, HTTPStatus.UNAUTHORIZED)
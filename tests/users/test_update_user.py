@@ -1,11 +1,11 @@
 from http import HTTPStatus
 
 from django.contrib.auth.hashers import check_password
-from django.test import TestCase
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
 from tests.factories import UserFactory
+from tests.utils import TestCase
 from users.models import User
 
 
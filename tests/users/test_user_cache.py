@@ -0,0 +1,106 @@
+from http import HTTPStatus
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from posts.views import FeedViewSet
+from tests.factories import UserFactory
+from tests.utils import TestCase
+from users.authentication import CachedJWTAuthentication
+from users.cache import user_cache
+
+URL = "/feed/"
+
+
+@override_settings(AUTHENTICATION_BACKENDS=['users.backends.CachedModelBackend'])
+class TestUserCache(TestCase):
+    """Test suite for the process-local cache of the authenticated users."""
+
+    def setUp(self):
+        cache.clear()
+        user_cache.clear()
+        # the views read DEFAULT_AUTHENTICATION_CLASSES when defined
+        patcher = mock.patch.object(
+            FeedViewSet,
+            'authentication_classes',
+            [CachedJWTAuthentication, SessionAuthentication],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.user = UserFactory()
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(self.user)}'
+        )
+
+    def get_feed(self, status=HTTPStatus.OK):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path=URL)
+        self.assertEqual(response.status_code, status)
+        return [q['sql'] for q in queries if 'FROM "users_user"' in q['sql']]
+
+    def test_user_loaded_once(self):
+        """The user is queried by the first request only."""
+        self.assertTrue(self.get_feed())
+        self.assertFalse(self.get_feed())
+        self.assertEqual(user_cache.stats()['hits'], 1)
+        self.assertEqual(user_cache.stats()['misses'], 1)
+
+    def test_change_invalidates_user(self):
+        """Saving the user makes the next request reload it."""
+        self.get_feed()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.get_feed(status=HTTPStatus.UNAUTHORIZED)
+        self.assertEqual(user_cache.stats()['misses'], 2)
+
+    @override_settings(USER_CACHE_MAX_AGE=0)
+    def test_expired_user_reloaded(self):
+        """A user cached for longer than USER_CACHE_MAX_AGE is reloaded."""
+        self.get_feed()
+        self.assertTrue(self.get_feed())
+        self.assertEqual(user_cache.stats()['misses'], 2)
+
+    def test_deleted_user_rejected(self):
+        """A deleted user is not served from the cache."""
+        self.get_feed()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.delete()
+        self.get_feed(status=HTTPStatus.UNAUTHORIZED)
+
+    def test_session_user_cached(self):
+        """The session authentication reads the users through the cache as well."""
+        client = APIClient()
+        client.force_login(self.user)
+        for _ in range(2):
+            self.assertEqual(client.get(path=URL).status_code, HTTPStatus.OK)
+        self.assertEqual(user_cache.stats()['hits'], 1)
+
+    @override_settings(USER_CACHE_SIZE=1)
+    def test_least_recently_used_evicted(self):
+        """The cache keeps at most USER_CACHE_SIZE users."""
+        other = UserFactory()
+        self.assertEqual(user_cache.get(self.user.pk), self.user)
+        self.assertEqual(user_cache.get(other.pk), other)
+        self.assertEqual(user_cache.stats()['size'], 1)
+        user_cache.get(self.user.pk)
+        self.assertEqual(user_cache.stats()['misses'], 3)
+
+    def test_stats_for_admins_only(self):
+        """Only admins can read the statistics of the cache."""
+        self.get_feed()
+        response = self.client.get(path='/users/cache-stats/')
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
+        admin = APIClient()
+        admin.force_authenticate(UserFactory(is_staff=True))
+        response = admin.get(path='/users/cache-stats/')
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.data['misses'], 1)
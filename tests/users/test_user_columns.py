@@ -0,0 +1,35 @@
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory
+from tests.utils import TestCase, forbid_deferred_loading
+
+
+class TestUserColumns(TestCase):
+    """Test suite checking the columns loaded by the users endpoints."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+        UserFactory.create_batch(size=3)
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestUserColumns.user)
+
+    def test_password_is_not_loaded(self):
+        """The users list and detail do not fetch the password hashes."""
+        for url in ("/users/", f"/users/{TestUserColumns.user.pk}/"):
+            with self.subTest(url=url):
+                with CaptureQueriesContext(connection) as queries, forbid_deferred_loading():
+                    response = self.authorized_client.get(path=url)
+                self.assertEqual(response.status_code, HTTPStatus.OK)
+                # the first queries load the session and the request user
+                view_queries = [
+                    q['sql'] for q in queries if 'django_session' not in q['sql']
+                ][1:]
+                self.assertNotIn('password', ' '.join(view_queries))
@@ -0,0 +1,61 @@
+from http import HTTPStatus
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from tests.factories import UserFactory
+from tests.utils import TestCase
+
+
+class TestUserConditionalGet(TestCase):
+    """Test suite for conditional requests to the users endpoints."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.user = UserFactory()
+        cls.url = f"/users/{cls.user.pk}/"
+
+    def setUp(self):
+        self.authorized_client = APIClient()
+        self.authorized_client.force_login(TestUserConditionalGet.user)
+
+    def test_user_detail_not_modified(self):
+        """A matching ETag is answered with 304 until the user is updated."""
+        etag = self.authorized_client.get(path=TestUserConditionalGet.url)['ETag']
+        response = self.authorized_client.get(
+            path=TestUserConditionalGet.url, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+        TestUserConditionalGet.user.save()
+        response = self.authorized_client.get(
+            path=TestUserConditionalGet.url, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+
+    def test_user_list_not_modified(self):
+        """The users list supports conditional requests."""
+        etag = self.authorized_client.get(path="/users/")['ETag']
+        response = self.authorized_client.get(path="/users/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+
+    def test_user_list_validated_by_aggregate(self):
+        """The list is validated by one aggregate query and follows deletions."""
+        other = UserFactory()
+        etag = self.authorized_client.get(path="/users/")['ETag']
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.authorized_client.get(path="/users/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.NOT_MODIFIED)
+        # besides the session loading the request user
+        [validators] = [
+            q['sql'] for q in queries
+            if 'FROM "users_user"' in q['sql'] and '"users_user"."id" =' not in q['sql']
+        ]
+        self.assertIn('COUNT(', validators)
+
+        other.delete()
+        response = self.authorized_client.get(path="/users/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, HTTPStatus.OK)
@@ -1,10 +1,10 @@
 from http import HTTPStatus
 
-from django.test import TestCase
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
 from tests.factories import UserFactory
+from tests.utils import TestCase
 from users.serializers import UserDetailSerializer
 
 
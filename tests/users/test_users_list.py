@@ -1,11 +1,12 @@
+import json
 from http import HTTPStatus
 
 from django.conf import settings
-from django.test import TestCase
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.test import APIClient
 
 from tests.factories import UserFactory
+from tests.utils import TestCase
 from users.models import User
 
 ALLOWED_DOMAINS = settings.ALLOWED_EMAIL_DOMAINS
@@ -33,6 +34,17 @@ class TestUserList(TestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertEqual(len(response.data), User.objects.count())
 
+    def test_user_list_stream(self):
+        """Test for streaming the list of users without the passwords."""
+        response = self.authorized_client.get(path=f"{TestUserList.url}?stream=ndjson")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        rows = [
+            json.loads(line)
+            for line in b''.join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(len(rows), User.objects.count())
+        self.assertNotIn('password', rows[0])
+
     def test_user_list_unauthorised(self):
         """Test for retrieving a list of users by an unauthorised user."""
         response = self.guest_client.get(path=TestUserList.url)
@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from unittest import mock
+
+from django import test
+from django.core.cache import cache
+from django.db.models import Model
+
+
+class TestCase(test.TestCase):
+    """
+    TestCase starting every test with an empty cache.
+
+    The transaction of a test is rolled back without running its on_commit
+    callbacks, so posts.signals and users.signals never invalidate what the
+    test cached, and the next tests would be served its responses.
+
+    """
+
+    def _pre_setup(self):
+        super()._pre_setup()
+        cache.clear()
+
+
+@contextmanager
+def forbid_deferred_loading():
+    """
+    Fail the test when a deferred field of any model instance is read,
+    which would otherwise silently run one extra query per instance.
+
+    """
+    refresh_from_db = Model.refresh_from_db
+
+    def refresh_deferred_fields(instance, using=None, fields=None):
+        if fields is not None:
+            raise AssertionError(
+                f'Deferred field(s) {", ".join(fields)} of {instance!r} were loaded.'
+            )
+        return refresh_from_db(instance, using=using, fields=fields)
+
+    with mock.patch.object(Model, 'refresh_from_db', refresh_deferred_fields):
+        yield
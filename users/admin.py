@@ -1,10 +1,11 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
+from blogger.admin import EstimatedCountPaginator, TrigramSearchMixin
 from users.models import User
 
 
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(TrigramSearchMixin, BaseUserAdmin):
     list_display = (
         'id',
         'username',
@@ -16,6 +17,8 @@ class UserAdmin(BaseUserAdmin):
         'date_updated',
     )
     search_fields = ('username',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ('last_login', 'date_joined', 'date_joined')
     fieldsets = (
         (None, {'fields': (
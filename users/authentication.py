@@ -0,0 +1,114 @@
+import time
+from datetime import date
+
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import user_cache
+from .models import User
+
+# the user fields embedded in the access tokens, see ClaimsJWTAuthentication
+CLAIM_FIELDS = ('username', 'is_active', 'is_staff', 'adult_since')
+# the User.date_updated the claims were read at
+VERSION_CLAIM = 'user_updated'
+STALE_CLAIMS_KEY = 'users:stale-claims:{}'
+
+
+def add_user_claims(token, user: User):
+    """Embed the fields of the user read by the permissions in the token."""
+    for field in CLAIM_FIELDS:
+        value = getattr(user, field)
+        token[field] = value.isoformat() if isinstance(value, date) else value
+    token[VERSION_CLAIM] = user.date_updated.timestamp()
+    return token
+
+
+def mark_claims_stale(*user_ids, version: float = None):
+    """
+    Make the tokens issued for the users before the change ``version``, the
+    timestamp of the change, load the user from the database, for as long
+    as they may be valid.
+
+    """
+    if version is None:
+        version = time.time()
+    cache.set_many(
+        {STALE_CLAIMS_KEY.format(user_id): version for user_id in user_ids},
+        timeout=int(api_settings.ACCESS_TOKEN_LIFETIME.total_seconds()),
+    )
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication building the user from the claims of the token.
+
+    The access tokens issued by users.serializers.ClaimsTokenObtainPairSerializer
+    carry the fields in CLAIM_FIELDS, so the permissions are answered without
+    loading the user row. Any other field is loaded on first access, as a
+    deferred field.
+
+    Changing or deleting a user marks the claims read before the change as
+    stale in the cache, see users.signals; such tokens, as well as the tokens
+    without the claims, fall back to the database lookup of
+    JWTAuthentication, which rejects inactive and deleted users. Changes
+    made by ``QuerySet.update()`` send no signals and must call
+    mark_claims_stale themselves.
+
+    The revocation is only seen by the workers sharing the cache. With the
+    process-local LocMemCache used when ``REDIS_URL`` is not set, the other
+    workers keep accepting the claims of a deactivated or demoted user until
+    the access token expires, for up to ``ACCESS_TOKEN_LIFETIME``. Deploy
+    several workers with claims authentication behind Redis only.
+
+    """
+
+    def get_user(self, validated_token):
+        if any(field not in validated_token for field in (*CLAIM_FIELDS, VERSION_CLAIM)):
+            return super().get_user(validated_token)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        stale_version = cache.get(STALE_CLAIMS_KEY.format(user_id))
+        if stale_version is not None and validated_token[VERSION_CLAIM] < stale_version:
+            return super().get_user(validated_token)
+        return self.get_token_user(validated_token)
+
+    def get_token_user(self, validated_token) -> User:
+        values = {
+            field: validated_token[field] for field in CLAIM_FIELDS
+        }
+        if not values['is_active']:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        values['adult_since'] = date.fromisoformat(values['adult_since'])
+        values[api_settings.USER_ID_FIELD] = validated_token[api_settings.USER_ID_CLAIM]
+        # a user built like a row loaded with only() the claim fields, whose
+        # values from_db() expects in the order of the model fields
+        fields = [
+            field.attname for field in User._meta.concrete_fields if field.attname in values
+        ]
+        return User.from_db(
+            router.db_for_read(User), fields, [values[field] for field in fields]
+        )
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication loading the user through the process-local
+    users.cache.user_cache instead of querying it on every request.
+
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = user_cache.get(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,15 @@
+from django.contrib.auth.backends import ModelBackend
+
+from .cache import user_cache
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    ModelBackend loading the user of a session through the process-local
+    users.cache.user_cache, which serves SessionAuthentication and the admin.
+
+    """
+
+    def get_user(self, user_id):
+        user = user_cache.get(user_id)
+        return user if self.user_can_authenticate(user) else None
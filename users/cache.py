@@ -0,0 +1,101 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .models import User
+
+VERSION_KEY = 'users:version:{}'
+
+
+class UserCache:
+    """
+    A bounded, thread-safe LRU cache of the users loaded by the
+    authentication, local to the process.
+
+    Every entry is the user row with its ``date_updated``. An entry is only
+    used while it matches the version of the user in the default cache,
+    which users.signals sets on each change of the user, and for at most
+    ``USER_CACHE_MAX_AGE`` seconds.
+
+    A change made by one worker only invalidates the entries of the others
+    when they share the cache, for the price of one cache lookup instead of
+    a query. With the process-local LocMemCache used when ``REDIS_URL`` is
+    not set, the other workers keep a deactivated or demoted user for up to
+    ``USER_CACHE_MAX_AGE`` seconds.
+
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id):
+        """Return a copy of the user, or None if it does not exist."""
+        key = VERSION_KEY.format(user_id)
+        version = cache.get(key)
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if (
+                entry is not None and version is not None and entry[1] == version
+                and time.monotonic() - entry[2] < settings.USER_CACHE_MAX_AGE
+            ):
+                self.entries.move_to_end(user_id)
+                self.hits += 1
+                # requests may change their user, never the cached one
+                return copy.copy(entry[0])
+            self.misses += 1
+
+        user = User.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        version = user.date_updated.isoformat()
+        # add() never replaces a version set by a later change of the user
+        cache.add(key, version, timeout=None)
+        with self.lock:
+            self.entries[user_id] = (user, version, time.monotonic())
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+        return copy.copy(user)
+
+    def stats(self) -> dict:
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else None,
+            }
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+
+user_cache = UserCache(settings.USER_CACHE_SIZE)
+
+
+def set_user_version(user: User):
+    cache.set(VERSION_KEY.format(user.pk), user.date_updated.isoformat(), timeout=None)
+
+
+def delete_user_versions(*user_ids):
+    cache.delete_many([VERSION_KEY.format(user_id) for user_id in user_ids])
+
+
+@receiver(setting_changed)
+def reset_user_cache_on_setting_change(setting, value, **kwargs):
+    if setting == 'USER_CACHE_SIZE':
+        user_cache.max_size = value
+        user_cache.clear()
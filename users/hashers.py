@@ -0,0 +1,41 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher
+
+
+def hash_passwords(passwords, iterations=None, workers=None) -> list:
+    """
+    Hash the passwords with the default hasher, in a pool of ``workers``
+    processes, since each hash keeps a core busy, or in place if 0. The
+    requests use PASSWORD_HASHING_WORKERS, manage.py provision_users all
+    the cores.
+
+    ``iterations`` overrides the work factor of the PBKDF2 hashers, which is
+    stored in each hash: the passwords of imported users can be hashed
+    faster, and Django rehashes them with the default work factor on the
+    first login of each user. It is ignored by the other hashers.
+
+    """
+    passwords = list(passwords)
+    if iterations is None:
+        iterations = settings.PASSWORD_HASHING_ITERATIONS
+    if workers is None:
+        workers = settings.PASSWORD_HASHING_WORKERS
+    hash_password = partial(_hash_password, get_hasher().algorithm, iterations)
+    if workers == 0 or len(passwords) < 2:
+        return [hash_password(password) for password in passwords]
+
+    # django.setup for the platforms starting the workers afresh
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as executor:
+        chunksize = max(1, len(passwords) // (workers * 4))
+        return list(executor.map(hash_password, passwords, chunksize=chunksize))
+
+
+def _hash_password(algorithm, iterations, password) -> str:
+    hasher = get_hasher(algorithm)
+    if iterations and hasattr(hasher, 'iterations'):
+        return hasher.encode(password, hasher.salt(), iterations)
+    return hasher.encode(password, hasher.salt())
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Max
+
+from users.authentication import mark_claims_stale
+from users.cache import delete_user_versions
+from users.models import AdultSince, User
+
+
+class Command(BaseCommand):
+    help = "Recompute User.adult_since of every user, after a change of USER_MIN_AGE."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=10000,
+            help='Range of user ids updated per transaction.',
+        )
+
+    def handle(self, *args, batch_size, **options):
+        last_id = User.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        updated = 0
+        for start in range(0, last_id + 1, batch_size):
+            with transaction.atomic():
+                # only the users whose date changes are written
+                user_ids = list(
+                    User.objects.filter(id__gte=start, id__lt=start + batch_size)
+                    .exclude(adult_since=AdultSince())
+                    .select_for_update()
+                    .values_list('id', flat=True)
+                )
+                User.objects.filter(id__in=user_ids).update(adult_since=AdultSince())
+            # update() sends no signals, see users.signals
+            mark_claims_stale(*user_ids)
+            delete_user_versions(*user_ids)
+            updated += len(user_ids)
+
+        self.stdout.write(self.style.SUCCESS(f'Updated {updated} users.'))
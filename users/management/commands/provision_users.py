@@ -0,0 +1,79 @@
+import csv
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from users.serializers import UserCreateUpdateSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the users of a CSV file with the columns username, password, "
+        "birthday and optionally email and phone_number."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to the CSV file.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of users inserted per query.',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            help='PBKDF2 iterations of the password hashes, see users.hashers.',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count(),
+            help='Number of processes hashing the passwords, 0 to hash them in place.',
+        )
+
+    def handle(self, *args, path, batch_size, iterations, workers, **options):
+        serializer = UserCreateUpdateSerializer(
+            many=True,
+            context={'password_iterations': iterations, 'password_workers': workers},
+        )
+        unique_fields = serializer.unique_fields
+        created = failed = 0
+        with open(path, newline='', encoding='utf-8') as file:
+            batch, seen = [], {field: set() for field in unique_fields}
+            # line 1 is the header
+            for line, row in enumerate(csv.DictReader(file), start=2):
+                row_serializer = UserCreateUpdateSerializer(
+                    data={key: value for key, value in row.items() if value}
+                )
+                if not row_serializer.is_valid():
+                    self.stderr.write(f'Line {line}: {row_serializer.errors}')
+                    failed += 1
+                    continue
+                attrs = row_serializer.validated_data
+                duplicates = [
+                    field for field in unique_fields
+                    if attrs.get(field) is not None and str(attrs[field]) in seen[field]
+                ]
+                if duplicates:
+                    self.stderr.write(f'Line {line}: duplicate {", ".join(duplicates)}')
+                    failed += 1
+                    continue
+                for field in unique_fields:
+                    if attrs.get(field) is not None:
+                        seen[field].add(str(attrs[field]))
+                batch.append(attrs)
+                if len(batch) == batch_size:
+                    created += self.create(serializer, batch)
+                    batch = []
+            if batch:
+                created += self.create(serializer, batch)
+
+        self.stdout.write(self.style.SUCCESS(f'Created {created} users, skipped {failed}.'))
+
+    def create(self, serializer, validated_data) -> int:
+        # hashed before the transaction, which is only held for the INSERT
+        validated_data = serializer.hash_passwords(validated_data)
+        with transaction.atomic():
+            return len(serializer.create(validated_data))
@@ -0,0 +1,37 @@
+# Generated by Django 4.1.7 on 2026-10-18 07:59
+
+from django.contrib.postgres.operations import AddIndexConcurrently, TrigramExtension
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("users", "0003_user_date_updated_alter_user_email"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AlterField(
+            model_name="user",
+            name="date_joined",
+            field=models.DateTimeField(
+                auto_now_add=True, verbose_name="Дата регистрации"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="gin_trgm_ops",
+                ),
+                name="users_user_username_trgm_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:20
+
+from django.conf import settings
+from django.db import migrations, models
+import users.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_follow"),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name="user",
+            managers=[
+                ("objects", users.models.UserManager()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="adult_since",
+            field=models.DateField(
+                editable=False, null=True, verbose_name="Совершеннолетие"
+            ),
+        ),
+        # the same as manage.py backfill_adult_since
+        migrations.RunSQL(
+            [(
+                "UPDATE users_user "
+                "SET adult_since = birthday + make_interval(years => %s)",
+                [settings.USER_MIN_AGE],
+            )],
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="adult_since",
+            field=models.DateField(editable=False, verbose_name="Совершеннолетие"),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-18 08:20
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ("users", "0006_user_adult_since"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="user",
+            index=models.Index(
+                fields=["adult_since"], name="users_user_adult_since_idx"
+            ),
+        ),
+    ]
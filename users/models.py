@@ -1,17 +1,67 @@
 import re
+from datetime import date
 
+from dateutil.relativedelta import relativedelta
 from django.conf import settings
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import RegexValidator
 from django.db import models
+from django.db.models.functions import Cast, Upper
 from phonenumber_field.modelfields import PhoneNumberField
 
 ALLOWED_DOMAINS = settings.ALLOWED_EMAIL_DOMAINS
 
 
+def get_adult_since(birthday: date, min_age: int = None) -> date:
+    """The date the user born on ``birthday`` becomes ``USER_MIN_AGE`` years old."""
+    if min_age is None:
+        min_age = settings.USER_MIN_AGE
+    return birthday + relativedelta(years=min_age)
+
+
+class AdultSince(Cast):
+    """
+    The SQL counterpart of get_adult_since, for updating many users at once.
+
+    Adding years to February 29 gives February 28 in both.
+
+    """
+    def __init__(self, birthday='birthday', min_age=None):
+        if min_age is None:
+            min_age = settings.USER_MIN_AGE
+        years = models.Func(
+            models.Value(min_age),
+            template='make_interval(years => %(expressions)s)',
+            output_field=models.DurationField(),
+        )
+        super().__init__(
+            models.ExpressionWrapper(
+                models.F(birthday) + years, output_field=models.DateTimeField()
+            ),
+            output_field=models.DateField(),
+        )
+
+
+class UserQuerySet(models.QuerySet):
+
+    def adults(self):
+        """The users old enough to post, see settings.USER_MIN_AGE."""
+        return self.filter(adult_since__lte=date.today())
+
+    def minors(self):
+        return self.filter(adult_since__gt=date.today())
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    pass
+
+
 class User(AbstractUser):
     REQUIRED_FIELDS = ["birthday"]
 
+    objects = UserManager()
+
     phone_number = PhoneNumberField(
         unique=True,
         verbose_name='Номер телефона',
@@ -21,6 +71,11 @@ class User(AbstractUser):
     birthday = models.DateField(
         verbose_name='Дата рождения',
     )
+    # recomputed with manage.py backfill_adult_since when USER_MIN_AGE changes
+    adult_since = models.DateField(
+        verbose_name='Совершеннолетие',
+        editable=False,
+    )
     email = models.EmailField(
         verbose_name='Почта',
         validators=[RegexValidator(
@@ -37,7 +92,72 @@ class User(AbstractUser):
         auto_now=True,
         verbose_name="Дата редактирования",
     )
+    following = models.ManyToManyField(
+        'self',
+        through='Follow',
+        through_fields=('follower', 'author'),
+        symmetrical=False,
+        related_name='followers',
+        verbose_name='Подписки',
+    )
 
     class Meta:
         verbose_name = "Пользователь"
         verbose_name_plural = "Пользователи"
+        indexes = [
+            # back the admin search, see blogger.admin.TrigramSearchMixin
+            GinIndex(
+                OpClass(Upper('username'), name='gin_trgm_ops'),
+                name='users_user_username_trgm_idx',
+            ),
+            # the users who may post, see UserQuerySet.adults
+            models.Index(fields=('adult_since',), name='users_user_adult_since_idx'),
+        ]
+
+    def save(self, *args, update_fields=None, **kwargs):
+        self.adult_since = get_adult_since(self.birthday)
+        if update_fields is not None and 'birthday' in update_fields:
+            update_fields = {*update_fields, 'adult_since'}
+        super().save(*args, update_fields=update_fields, **kwargs)
+
+    @property
+    def is_adult(self) -> bool:
+        return self.adult_since <= date.today()
+
+
+class Follow(models.Model):
+    """Subscriptions of users to the posts of other users."""
+    follower = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Подписчик',
+    )
+    author = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='Автор',
+    )
+    created = models.DateTimeField(
+        auto_now_add=True,
+        verbose_name='Дата подписки',
+    )
+
+    class Meta:
+        verbose_name = 'Подписка'
+        verbose_name_plural = 'Подписки'
+        constraints = [
+            # its index also serves the feed, which reads the authors by follower
+            models.UniqueConstraint(
+                fields=('follower', 'author'),
+                name='users_follow_follower_author_uniq',
+            ),
+            models.CheckConstraint(
+                check=~models.Q(follower=models.F('author')),
+                name='users_follow_not_self',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.follower_id} -> {self.author_id}'
@@ -7,6 +7,6 @@ class IsAdminOrRequestUser(permissions.BasePermission):
     message = "У Вас нет права редактировать данные данного пользователя."
 
     def has_object_permission(self, request, view, obj: User) -> bool:
-        if request.user.is_staff or obj == request.user:
+        if request.user.is_staff or obj.pk == request.user.pk:
             return True
         return False
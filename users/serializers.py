@@ -1,9 +1,70 @@
-import re
-
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
+from rest_framework.fields import get_error_detail
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import (TokenObtainPairSerializer,
+                                                  TokenRefreshSerializer)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from .authentication import CLAIM_FIELDS, add_user_claims
+from .hashers import hash_passwords
+from .models import User, get_adult_since
+from .validators import check_password_strength, run_other_validators
+
+
+class UserBulkCreateListSerializer(serializers.ListSerializer):
+    """
+    Insert the validated users with a single bulk INSERT.
+
+    The passwords are hashed by validate(), see users.hashers, so that no
+    transaction is held open while they are, and the validated data holds
+    their hashes. The ``password_iterations`` and ``password_workers`` of the
+    context override the PASSWORD_HASHING_ITERATIONS and
+    PASSWORD_HASHING_WORKERS settings.
+
+    """
+    # checked against the database by the child, within the list here
+    unique_fields = ('username', 'phone_number')
+
+    def validate(self, attrs):
+        errors = {}
+        for field in self.unique_fields:
+            indexes = {}
+            for index, item in enumerate(attrs):
+                if item.get(field) is not None:
+                    indexes.setdefault(str(item[field]), []).append(index)
+            duplicates = [
+                f"«{value}» ({', '.join(map(str, found))})"
+                for value, found in indexes.items() if len(found) > 1
+            ]
+            if duplicates:
+                errors[field] = [f"Повторяются в списке: {'; '.join(duplicates)}."]
+        if errors:
+            raise ValidationError(errors)
+        return self.hash_passwords(attrs)
+
+    def hash_passwords(self, validated_data) -> list:
+        """Replace the passwords of the validated users with their hashes."""
+        passwords = hash_passwords(
+            [attrs['password'] for attrs in validated_data],
+            iterations=self.context.get('password_iterations'),
+            workers=self.context.get('password_workers'),
+        )
+        return [
+            {**attrs, 'password': password}
+            for attrs, password in zip(validated_data, passwords)
+        ]
 
-from .models import User
+    def create(self, validated_data):
+        users = []
+        for attrs in validated_data:
+            user = User(**attrs)
+            # bulk_create does not call save()
+            user.adult_since = get_adult_since(user.birthday)
+            users.append(user)
+        return User.objects.bulk_create(users)
 
 
 class UserCreateUpdateSerializer(serializers.ModelSerializer):
@@ -12,6 +73,7 @@ class UserCreateUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = User
+        list_serializer_class = UserBulkCreateListSerializer
         read_only_fields = ["id", "date_joined", "date_updated"]
         fields = [
             'id',
@@ -27,21 +89,30 @@ class UserCreateUpdateSerializer(serializers.ModelSerializer):
         and contains minimum 8 symbols.
 
         """
-        if not re.match(r'^((?=.*?[0-9]).*).{8,}$', value):
-            raise ValidationError(
-                "Пароль должен содержать не менее 8 символов,"
-                "из которых хотя бы одна цифра.",
-                code='password_is_weak',
-            )
+        check_password_strength(value)
         return value
 
+    def validate(self, attrs):
+        """Validate a strong password against the other AUTH_PASSWORD_VALIDATORS."""
+        if 'password' in attrs:
+            # compared with the attributes of the user being saved
+            user = User(**{
+                field: attrs.get(field, getattr(self.instance, field, None))
+                for field in ('username', 'email')
+            })
+            try:
+                run_other_validators(attrs['password'], user)
+            except DjangoValidationError as exc:
+                raise ValidationError({'password': get_error_detail(exc)})
+        return attrs
+
     def create(self, validated_data: dict) -> User:
         """Create a new User instance hashing the password."""
-        password = validated_data['password']
+        password = validated_data.pop('password')
 
-        user = User.objects.create(**validated_data)
+        user = User(**validated_data)
         user.set_password(password)
-        user.save()
+        user.save(force_insert=True)
         return user
 
     def update(self, instance, validated_data):
@@ -68,3 +139,34 @@ class UserDetailSerializer(serializers.ModelSerializer):
             'date_joined',
             'date_updated',
         ]
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Issue tokens carrying the claims of users.authentication.CLAIM_FIELDS."""
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class ClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh the access token with the current claims of the user, so they
+    are never older than the access token lifetime, and refuse to refresh
+    the tokens of inactive or deleted users.
+
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        user_id = RefreshToken(attrs['refresh'])[api_settings.USER_ID_CLAIM]
+        user = User.objects.only(*CLAIM_FIELDS, 'date_updated').filter(
+            **{api_settings.USER_ID_FIELD: user_id}
+        ).first()
+        if user is None or not user.is_active:
+            raise AuthenticationFailed('Пользователь не найден или неактивен.', code='user_inactive')
+
+        data['access'] = str(add_user_claims(AccessToken(data['access']), user))
+        if 'refresh' in data:
+            data['refresh'] = str(add_user_claims(RefreshToken(data['refresh']), user))
+        return data
@@ -0,0 +1,43 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import mark_claims_stale
+from .cache import delete_user_versions, set_user_version
+from .models import User
+
+
+@receiver(post_save, sender=User)
+def invalidate_token_claims(sender, instance, created, update_fields, **kwargs):
+    # a new user has no tokens yet, and logging in only updates last_login
+    if created or update_fields == frozenset({'last_login'}):
+        return
+    if update_fields is None or 'date_updated' in update_fields:
+        mark_claims_stale(instance.pk, version=instance.date_updated.timestamp())
+    else:
+        # date_updated was not saved and still equals the claims of the tokens
+        mark_claims_stale(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user_claims(sender, instance, **kwargs):
+    mark_claims_stale(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def invalidate_cached_user(sender, instance, created, update_fields, **kwargs):
+    # after the commit, so the workers reload the committed row
+    if created:
+        return
+    if update_fields is None or 'date_updated' in update_fields:
+        transaction.on_commit(lambda: set_user_version(instance))
+    else:
+        # date_updated was not saved, the next load sets the version
+        transaction.on_commit(lambda: delete_user_versions(instance.pk))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_cached_user(sender, instance, **kwargs):
+    # the pk of a deleted instance is set to None
+    user_id = instance.pk
+    transaction.on_commit(lambda: delete_user_versions(user_id))
@@ -1,7 +1,41 @@
+import gzip
 import re
+from functools import lru_cache
 
+from django.contrib.auth import password_validation
 from django.core.exceptions import ValidationError
 
+# at least 8 characters, one of them a digit
+STRONG_PASSWORD_PATTERN = re.compile(r'^((?=.*?[0-9]).*).{8,}$')
+
+
+def check_password_strength(password: str):
+    """
+    Validate that the password contains minimum one digit and contains
+    minimum 8 symbols, with the message of the API. ComplexPasswordValidator
+    checks the same pattern with its own message.
+
+    """
+    if not STRONG_PASSWORD_PATTERN.match(password):
+        raise ValidationError(
+            "Пароль должен содержать не менее 8 символов,"
+            "из которых хотя бы одна цифра.",
+            code='password_is_weak',
+        )
+
+
+def run_other_validators(password: str, user=None):
+    """
+    Run the AUTH_PASSWORD_VALIDATORS but ComplexPasswordValidator, for the
+    passwords check_password_strength has already accepted.
+
+    """
+    validators = [
+        validator for validator in password_validation.get_default_password_validators()
+        if not isinstance(validator, ComplexPasswordValidator)
+    ]
+    password_validation.validate_password(password, user, password_validators=validators)
+
 
 class ComplexPasswordValidator:
     """
@@ -9,7 +43,7 @@ class ComplexPasswordValidator:
 
     """
     def validate(self, password, user=None):
-        if not re.match(r'^((?=.*?[0-9]).*).{8,}$', password):
+        if not STRONG_PASSWORD_PATTERN.match(password):
             raise ValidationError(
                 "This password is not strong.",
                 code='password_is_weak',
@@ -17,3 +51,26 @@ class ComplexPasswordValidator:
 
     def get_help_text(self):
         return "Your password must contain at least 8 symbols including minimum 1 number."
+
+
+@lru_cache(maxsize=None)
+def load_common_passwords(path) -> frozenset:
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as file:
+            return frozenset(line.strip() for line in file)
+    except OSError:
+        with open(path) as file:
+            return frozenset(line.strip() for line in file)
+
+
+class CommonPasswordValidator(password_validation.CommonPasswordValidator):
+    """
+    CommonPasswordValidator reading each password list once per process
+    into a frozenset shared by all its instances. UsersConfig.ready loads
+    the validators at startup, so no request pays for decompressing the list.
+
+    """
+    def __init__(self, password_list_path=None):
+        if password_list_path is None:
+            password_list_path = self.DEFAULT_PASSWORD_LIST_PATH
+        self.passwords = load_common_passwords(password_list_path)
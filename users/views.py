@@ -1,18 +1,26 @@
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
 
-from .models import User
+from blogger.mixins import (BulkCreateMixin, ConditionalGetMixin, SerializerColumnsMixin,
+                            StreamingListMixin)
+from .cache import user_cache
+from .models import Follow, User
 from .permissions import IsAdminOrRequestUser
 from .serializers import UserCreateUpdateSerializer, UserDetailSerializer
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(StreamingListMixin, ConditionalGetMixin, SerializerColumnsMixin,
+                  BulkCreateMixin, viewsets.ModelViewSet):
     """
     A viewset for viewing and editing User instances.
 
     """
     serializer_class = UserCreateUpdateSerializer
     queryset = User.objects.all()
+    last_modified_field = 'date_updated'
 
     def get_permissions(self):
         """Instantiates and returns the list of permissions that this view requires."""
@@ -20,7 +28,7 @@ class UserViewSet(viewsets.ModelViewSet):
             permission_classes = [AllowAny]
         elif self.action in ('update', 'partial_update'):
             permission_classes = [IsAuthenticated, IsAdminOrRequestUser]
-        elif self.action == 'destroy':
+        elif self.action in ('destroy', 'bulk_create', 'cache_stats'):
             permission_classes = [IsAdminUser]
         else:
             permission_classes = [IsAuthenticated]
@@ -30,9 +38,38 @@ class UserViewSet(viewsets.ModelViewSet):
         """Returns the serializer class for each particular method"""
         if self.action in ('retrieve', 'list'):
             return UserDetailSerializer
-        elif self.action == "create":
+        elif self.action in ("create", "bulk_create"):
             return UserCreateUpdateSerializer
         elif self.action in ("partial_update", "update"):
             return UserCreateUpdateSerializer
         else:
             return UserDetailSerializer
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # the users who may post, or may not
+            adult = self.request.query_params.get('adult')
+            if adult in ('true', 'false'):
+                queryset = queryset.adults() if adult == 'true' else queryset.minors()
+        if self.action in ('destroy', 'follow'):
+            queryset = queryset.only('id')
+        return queryset
+
+    @action(detail=True, methods=['post', 'delete'])
+    def follow(self, request, *args, **kwargs):
+        """Follow (POST) or unfollow (DELETE) the posts of the user."""
+        author = self.get_object()
+        if request.method == 'DELETE':
+            Follow.objects.filter(follower=request.user, author=author).delete()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        if author.pk == request.user.pk:
+            raise ValidationError('Нельзя подписаться на самого себя.')
+        Follow.objects.get_or_create(follower=request.user, author=author)
+        return Response(status=status.HTTP_201_CREATED)
+
+    @action(detail=False, url_path='cache-stats')
+    def cache_stats(self, request, *args, **kwargs):
+        """The hits and misses of the user cache of this worker, see users.cache."""
+        return Response(user_cache.stats())